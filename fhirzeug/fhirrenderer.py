@@ -96,6 +96,10 @@ class FHIRStructureDefinitionRenderer(FHIRRenderer):
             source_path = self.generator_config.template.resource_source
             self.do_render(data, source_path, f_out=f_out)
 
+        registry_source = self.generator_config.template.registry_source
+        if registry_source is not None:
+            self.do_render({"classes": classes}, registry_source, f_out=f_out)
+
     def get_classes_to_render(self):
         """Recursively fetch all classes to render."""
         derive_graph = {}
@@ -128,6 +132,10 @@ class FHIRValueSetRenderer(FHIRRenderer):
     """Write ValueSet and CodeSystem contained in the FHIR spec."""
 
     def render(self, f_out):
+        source_path = self.generator_config.template.codesystems_source
+        if source_path is None:
+            return
+
         systems = [v for k, v in self.spec.codesystems.items()]
         for system in sorted(systems, key=lambda x: x.name):
             if not system.generate_enum:
@@ -137,7 +145,6 @@ class FHIRValueSetRenderer(FHIRRenderer):
                 "info": self.spec.info,
                 "system": system,
             }
-            source_path = self.generator_config.template.codesystems_source
             self.do_render(data, source_path, f_out=f_out)
 
 
@@ -0,0 +1,77 @@
+"""Compare the dataclasses with the pydantic models on the example corpus.
+
+Measure parse time (`r4.from_raw`), serialization time (`.json()`) and the memory
+retained per loaded resource. The pydantic models are measured too if the
+`pydantic_fhir` package is importable.
+
+Usage: python tests/benchmarks/bench_dataclasses.py [--number N]
+"""
+import argparse
+import timeit
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+from fhir_dataclasses import r4
+
+EXAMPLES_ROOT = Path(__file__).parent.parent.joinpath("test_examples", "examples")
+
+
+def measure(
+    from_raw: Callable[[str], Any],
+    to_json: Callable[[Any], str],
+    corpus: List[str],
+    number: int,
+) -> Dict[str, float]:
+    resources = [from_raw(raw) for raw in corpus]
+    parse = min(timeit.repeat(lambda: [from_raw(raw) for raw in corpus], number=number))
+    serialize = min(
+        timeit.repeat(
+            lambda: [to_json(resource) for resource in resources], number=number
+        )
+    )
+
+    tracemalloc.start()
+    try:
+        start, _ = tracemalloc.get_traced_memory()
+        resources = [from_raw(raw) for raw in corpus]
+        end, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {
+        "parse": parse / number,
+        "serialize": serialize / number,
+        "memory": (end - start) / len(corpus) / 1024,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=5, help="runs over the corpus")
+    args = parser.parse_args()
+
+    corpus = [path.read_text() for path in sorted(EXAMPLES_ROOT.glob("*.json"))]
+    print(f"{len(corpus)} documents, {args.number} runs")
+
+    candidates = {"dataclasses": (r4.from_raw, lambda resource: resource.json())}
+    try:
+        from pydantic_fhir import r4 as pydantic_r4
+    except ImportError:
+        print("pydantic_fhir is not installed, only dataclasses are measured.")
+    else:
+        candidates["pydantic"] = (
+            pydantic_r4.from_raw,
+            lambda resource: resource.json(by_alias=True, exclude_none=True),
+        )
+
+    for name, (from_raw, to_json) in candidates.items():
+        result = measure(from_raw, to_json, corpus, args.number)
+        print(
+            f"{name:>12}: parse {result['parse'] * 1e3:8.2f} ms, "
+            f"serialize {result['serialize'] * 1e3:8.2f} ms, "
+            f"{result['memory']:8.1f} KiB per resource"
+        )
+
+
+if __name__ == "__main__":
+    main()
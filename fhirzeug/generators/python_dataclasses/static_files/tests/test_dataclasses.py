@@ -0,0 +1,77 @@
+import decimal
+
+import pytest
+
+from fhir_dataclasses import r4
+
+
+def test_slots():
+    patient = r4.Patient(gender="male")
+    assert not hasattr(patient, "__dict__")
+    assert patient.active is None
+    with pytest.raises(AttributeError):
+        patient.unknown_field = True
+
+
+def test_resource_dispatch():
+    bundle = r4.from_dict(
+        {
+            "resourceType": "Bundle",
+            "type": "collection",
+            "entry": [
+                {"resource": {"resourceType": "Patient", "id": "p1"}},
+                {"resource": {"resourceType": "Organization", "name": "ACME"}},
+            ],
+        }
+    )
+    assert isinstance(bundle, r4.Bundle)
+    assert bundle.entry[0].resource == r4.Patient(id="p1")
+    assert bundle.entry[1].resource == r4.Organization(name="ACME")
+    assert bundle.to_json()["entry"][1] == {
+        "resource": {"resourceType": "Organization", "name": "ACME"}
+    }
+
+
+def test_primitive_extension():
+    data = {
+        "resourceType": "Patient",
+        "_gender": {"id": "g"},
+        "name": [{"given": ["A", None], "_given": [None, {"id": "x"}]}],
+    }
+    patient = r4.from_dict(data)
+    assert patient.gender is None
+    assert patient.gender__extension == r4.PrimitiveExtension(id="g")
+    assert patient.name[0].given == ["A", None]
+    assert patient.name[0].given__extension == [None, r4.PrimitiveExtension(id="x")]
+    assert patient.to_json() == data
+
+
+def test_decimal():
+    raw = '{"resourceType": "Observation", "valueQuantity": {"value": 1.50}}'
+    observation = r4.from_raw(raw)
+    assert observation.value_quantity.value == decimal.Decimal("1.50")
+    assert observation.json() == raw
+
+    observation = r4.from_dict(
+        {"resourceType": "Observation", "valueQuantity": {"value": 0.1}}
+    )
+    assert observation.value_quantity.value == decimal.Decimal("0.1")
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        {"id": "p1"},
+        {"resourceType": "Unknown"},
+        {"resourceType": "Patient", "unknown": True},
+        {"resourceType": "Patient", "contained": [{"resourceType": "Foo"}]},
+    ],
+)
+def test_invalid(data: dict):
+    with pytest.raises(ValueError):
+        r4.from_dict(data)
+
+
+def test_resource_type_mismatch():
+    with pytest.raises(ValueError):
+        r4.Patient.from_json({"resourceType": "Organization"})
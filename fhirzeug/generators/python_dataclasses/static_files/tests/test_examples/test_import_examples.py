@@ -0,0 +1,26 @@
+"""Test `fhir_dataclasses` on all official examples from specifications."""
+import json
+from pathlib import Path
+
+from fhir_dataclasses import r4
+
+
+def test_read(fhir_file: Path):
+    """Test if model is correctly read."""
+    with fhir_file.open() as f_in:
+        doc = json.load(f_in)
+
+    assert r4.from_dict(doc) is not None
+
+
+def test_read_write(fhir_file: Path):
+    """Test if a written model equals to the read version."""
+    json_in = fhir_file.read_text()
+    doc = r4.json_loads(json_in)
+
+    obj = r4.from_raw(json_in)
+    assert obj.to_json() == doc
+
+    json_str = obj.json()
+    assert r4.json_loads(json_str) == doc
+    assert r4.from_raw(json_str) == obj
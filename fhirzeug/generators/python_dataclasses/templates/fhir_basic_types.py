@@ -0,0 +1,15 @@
+# Primitive types are kept as decoded from JSON, without validation.
+# Names are the ones of the mapping rules, used to annotate the fields.
+FHIRString = str
+FHIRRequiredString = str
+FHIRDateTime = str
+FHIRDate = str
+FHIRInstant = str
+FHIRTime = str
+FHIRCode = str
+FHIROid = str
+FHIRId = str
+FHIRBase64Binary = str
+FHIRInt = int
+FHIRUnsignedInt = int
+FHIRPositiveInt = int
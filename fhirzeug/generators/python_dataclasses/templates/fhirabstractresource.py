@@ -0,0 +1,9 @@
+
+
+@fhir_dataclass
+class FHIRAbstractResource(FHIRAbstractBase):
+
+    resource_type: typing.ClassVar[str] = "FHIRAbstractResource"
+
+    def _to_json(self, out: typing.Dict[str, typing.Any]) -> None:
+        out["resourceType"] = self.resource_type
@@ -0,0 +1 @@
+# Resources are not validated by this target, no custom validator is defined.
@@ -0,0 +1,25 @@
+
+
+@fhir_dataclass
+class PrimitiveExtension(Element):
+    """Class to describe any extension of a primitive value.
+
+    Contains only `id` and `extension`.
+    """
+
+
+def from_dict(dict_: typing.Mapping[str, typing.Any]):
+    """Factory to load resources directly.
+
+    The resources will be instanciated based on their resourceType property."""
+    resource_type = dict_.get("resourceType")
+    if resource_type not in RESOURCE_TYPE_MAP:
+        raise ValueError(f"ResourceType '{resource_type}' is not a valid Resource.")
+    return RESOURCE_TYPE_MAP[resource_type].from_json(dict_)
+
+
+def from_raw(s: typing.Union[str, bytes, bytearray]):
+    """Factory to load resources directly from the raw json string.
+
+    The resources will be instanciated based on their resourceType property."""
+    return from_dict(json_loads(s))
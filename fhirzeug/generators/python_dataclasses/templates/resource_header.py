@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+import dataclasses
+import decimal
+import json
+import re
+import secrets
+import typing
+from collections.abc import Mapping
+
+# Field of JSON-primitive types can be extended in FHIR using an underscore
+# Example: field `given` (type `str`) is extended by `_given`.
+# The extension is stored in the attribute with a `__extension` suffix instead,
+# `given__extension` in this example.
+
+# Fields of a class by JSON name: attribute name, name of the class of the values
+# (None for JSON primitive values, which are kept as decoded) and whether the field
+# is an array. Generated for each class with its own fields.
+JSONField = typing.Tuple[str, typing.Optional[str], bool]
+
+
+class DecimalEncoder(json.JSONEncoder):
+    """JSON encoder writing `decimal.Decimal` values losslessly.
+
+    The encoding itself is done by the standard library (its C implementation when
+    available). Each decimal is first replaced by a placeholder string, unique to the
+    encoding call, which is then substituted by the exact decimal representation.
+    """
+
+    def iterencode(self, o, _one_shot=False):
+        decimals: typing.List[str] = []
+        placeholder = f"__decimal_{secrets.token_hex(8)}_"
+        pattern = re.compile(f'"{placeholder}([0-9]+)"')
+        default = self.default
+
+        def _default(obj):
+            if isinstance(obj, decimal.Decimal):
+                decimals.append(str(obj))
+                return placeholder + str(len(decimals) - 1)
+            if isinstance(obj, Mapping):
+                return dict(obj)
+            if isinstance(obj, typing.Iterable) and (not isinstance(obj, str)):
+                return list(obj)
+            return default(obj)
+
+        def _substitute(match: typing.Match) -> str:
+            return decimals[int(match.group(1))]
+
+        self.default = _default
+        try:
+            chunks = super().iterencode(o, _one_shot=_one_shot)
+        finally:
+            # The encoder reads `self.default` when built, it can be restored now.
+            self.default = default
+
+        for chunk in chunks:
+            if decimals:
+                chunk = pattern.sub(_substitute, chunk)
+            yield chunk
+
+
+def json_dumps(*args, **kwargs):
+    return json.dumps(*args, **kwargs, cls=DecimalEncoder)
+
+
+# Duplicated keys are not looked for, the documents are trusted.
+_json_decoder = json.JSONDecoder(parse_float=decimal.Decimal)
+
+
+def json_loads(s: typing.Union[str, bytes, bytearray]):
+    """Deserialize a JSON document, keeping decimals exact."""
+    if isinstance(s, (bytes, bytearray)):
+        s = s.decode(json.detect_encoding(s), "surrogatepass")
+    return _json_decoder.decode(s)
+
+
+def fhir_dataclass(cls):
+    """Make a dataclass of `cls` whose instances have `__slots__` and no `__dict__`.
+
+    Same as `dataclasses.dataclass(slots=True)` of Python 3.10: the class is
+    created again, with a slot for each of its own fields. Methods of the classes
+    must not use the zero-argument form of `super()`.
+    """
+    cls = dataclasses.dataclass(cls)
+    inherited = {
+        field.name
+        for base in cls.__mro__[1:]
+        if dataclasses.is_dataclass(base)
+        for field in dataclasses.fields(base)
+    }
+    own_fields = tuple(
+        field.name for field in dataclasses.fields(cls) if field.name not in inherited
+    )
+    namespace = dict(cls.__dict__)
+    for field_name in own_fields:
+        # Defaults are kept by `__init__`, they would conflict with the slots.
+        namespace.pop(field_name, None)
+    namespace.pop("__dict__", None)
+    namespace.pop("__weakref__", None)
+    namespace["__slots__"] = own_fields
+    return type(cls)(cls.__name__, cls.__bases__, namespace)
+
+
+@fhir_dataclass
+class FHIRAbstractBase:
+    """Abstract base class for all FHIR elements.
+
+    Elements are decoded from and encoded to JSON without any validation.
+    """
+
+    _json_fields: typing.ClassVar[typing.Dict[str, JSONField]] = {}
+
+    @classmethod
+    def from_json(cls, data: typing.Mapping[str, typing.Any]):
+        """Build an element from its JSON representation, as decoded by `json_loads`."""
+        table = _get_json_table(cls)
+        values = {}
+        for key, value in data.items():
+            field = table.get(key)
+            if field is None:
+                if key == "resourceType" and value == getattr(cls, "resource_type", None):
+                    continue
+                raise ValueError(f"'{key}' is not a field of {cls.__name__}.")
+            name, convert, is_list = field
+            if convert is not None and value is not None:
+                if is_list:
+                    value = [item if item is None else convert(item) for item in value]
+                else:
+                    value = convert(value)
+            values[name] = value
+        return cls(**values)
+
+    def to_json(self) -> typing.Dict[str, typing.Any]:
+        """Return the JSON representation of the element, without `None` values."""
+        out: typing.Dict[str, typing.Any] = {}
+        self._to_json(out)
+        return out
+
+    def _to_json(self, out: typing.Dict[str, typing.Any]) -> None:
+        """Write the fields of the element in `out`, generated for each class."""
+
+    def json(self, **kwargs) -> str:
+        """Return the JSON representation of the element as a string."""
+        return json_dumps(self.to_json(), **kwargs)
+
+
+_JSON_TABLES: typing.Dict[
+    type,
+    typing.Dict[
+        str,
+        typing.Tuple[str, typing.Optional[typing.Callable[[typing.Any], typing.Any]], bool],
+    ],
+] = {}
+
+
+def _to_decimal(value: typing.Any) -> decimal.Decimal:
+    if isinstance(value, decimal.Decimal):
+        return value
+    return decimal.Decimal(str(value))
+
+
+def _get_json_converter(
+    type_name: typing.Optional[str],
+) -> typing.Optional[typing.Callable[[typing.Any], typing.Any]]:
+    if type_name is None:
+        return None
+    if type_name == "decimal.Decimal":
+        return _to_decimal
+    if type_name == "Resource":
+        return from_dict
+    return globals()[type_name].from_json
+
+
+def _get_json_table(cls: type):
+    """Return the fields of a class and all its parents, computed on first use."""
+    table = _JSON_TABLES.get(cls)
+    if table is None:
+        table = {}
+        for klass in reversed(cls.__mro__):
+            for alias, (name, type_name, is_list) in klass.__dict__.get(
+                "_json_fields", {}
+            ).items():
+                table[alias] = (name, _get_json_converter(type_name), is_list)
+        _JSON_TABLES[cls] = table
+    return table
+
+
+def _encode_list(items: typing.List[typing.Any]) -> typing.List[typing.Any]:
+    """Encode a list of elements, which can contain `None` for primitive extensions."""
+    return [item if item is None else item.to_json() for item in items]
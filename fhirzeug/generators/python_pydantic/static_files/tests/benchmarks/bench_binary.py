@@ -0,0 +1,48 @@
+"""Benchmark the binary encoding of resources against JSON on the example corpus.
+
+Compare the size of the encoded corpus and the encoding and decoding times of
+`r4.to_binary` / `r4.from_binary` with the JSON text of `.fhir_json()`, loaded
+with `r4.from_raw` (validated) or `r4.construct_from_dict` (trusted).
+
+Usage: python tests/benchmarks/bench_binary.py [--number N]
+"""
+import argparse
+import timeit
+from pathlib import Path
+
+from pydantic_fhir import r4
+
+EXAMPLES_ROOT = Path(__file__).parent.parent.joinpath("test_examples", "examples")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=20, help="runs over the corpus")
+    args = parser.parse_args()
+
+    resources = [
+        r4.from_raw(path.read_text()) for path in sorted(EXAMPLES_ROOT.glob("*.json"))
+    ]
+    texts = [resource.fhir_json() for resource in resources]
+    blobs = [r4.to_binary(resource) for resource in resources]
+    print(f"{len(resources)} documents, {args.number} runs")
+    print(f"{'JSON size':>28}: {sum(len(text.encode()) for text in texts)} bytes")
+    print(f"{'binary size':>28}: {sum(len(blob) for blob in blobs)} bytes")
+
+    candidates = {
+        ".fhir_json()": lambda: [resource.fhir_json() for resource in resources],
+        "r4.to_binary": lambda: [r4.to_binary(resource) for resource in resources],
+        "r4.from_raw": lambda: [r4.from_raw(text) for text in texts],
+        "r4.construct_from_dict": lambda: [
+            r4.construct_from_dict(r4.json_loads(text)) for text in texts
+        ],
+        "r4.from_binary": lambda: [r4.from_binary(blob) for blob in blobs],
+    }
+    for name, run in candidates.items():
+        duration = min(timeit.repeat(run, number=args.number, repeat=3))
+        per_document = duration / (len(resources) * args.number) * 1e6
+        print(f"{name:>28}: {duration:.3f}s, {per_document:.1f} µs/document")
+
+
+if __name__ == "__main__":
+    main()
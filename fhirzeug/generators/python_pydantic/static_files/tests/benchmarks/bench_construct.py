@@ -0,0 +1,46 @@
+"""Benchmark the trusted construction of resources on the example corpus.
+
+Compare `r4.construct_from_dict`, which runs no validator, with `r4.from_dict`.
+
+Usage: python tests/benchmarks/bench_construct.py [--number N]
+"""
+import argparse
+import json
+import timeit
+from pathlib import Path
+
+from pydantic_fhir import r4
+
+EXAMPLES_ROOT = Path(__file__).parent.parent.joinpath("test_examples", "examples")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=5, help="runs over the corpus")
+    args = parser.parse_args()
+
+    # Trusted data is the output of previously validated resources.
+    corpus = [
+        r4.json_loads(
+            r4.from_dict(json.loads(path.read_text())).json(
+                by_alias=True, exclude_unset=True
+            )
+        )
+        for path in sorted(EXAMPLES_ROOT.glob("*.json"))
+    ]
+    print(f"{len(corpus)} documents, {args.number} runs")
+
+    candidates = {
+        "r4.from_dict": r4.from_dict,
+        "r4.construct_from_dict": r4.construct_from_dict,
+    }
+    for name, load in candidates.items():
+        duration = timeit.timeit(
+            lambda load=load: [load(doc) for doc in corpus], number=args.number
+        )
+        per_document = duration / (len(corpus) * args.number) * 1e6
+        print(f"{name:>22}: {duration:.3f}s, {per_document:.1f} µs/document")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""Benchmark the interning of repeated values on the example corpus.
+
+Load the corpus `--copies` times, as a cache of resources would, with and without
+an `r4.InternTable`, and compare the memory retained by the loaded resources and
+the loading time.
+
+Usage: python tests/benchmarks/bench_interning.py [--copies N] [--maxsize N]
+"""
+import argparse
+import time
+import tracemalloc
+from pathlib import Path
+from typing import List, Optional
+
+from pydantic_fhir import r4
+
+EXAMPLES_ROOT = Path(__file__).parent.parent.joinpath("test_examples", "examples")
+
+
+def measure(corpus: List[str], intern: Optional[r4.InternTable]) -> None:
+    tracemalloc.start()
+    try:
+        start_time = time.perf_counter()
+        start, _ = tracemalloc.get_traced_memory()
+        resources = [r4.from_raw(raw, intern=intern) for raw in corpus]
+        end, _ = tracemalloc.get_traced_memory()
+        duration = time.perf_counter() - start_time
+    finally:
+        tracemalloc.stop()
+
+    name = "without interning" if intern is None else "with interning"
+    retained = (end - start) / len(resources) / 1024
+    print(f"{name:>18}: {retained:8.1f} kB/resource, {duration:.3f}s")
+    if intern is not None:
+        print(
+            f"{'':>18}  {len(intern)} interned values, "
+            f"{intern.hits} hits, {intern.misses} misses"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--copies", type=int, default=20, help="loads of the corpus")
+    parser.add_argument("--maxsize", type=int, default=65536, help="interned values")
+    args = parser.parse_args()
+
+    examples = [path.read_text() for path in sorted(EXAMPLES_ROOT.glob("*.json"))]
+    corpus = examples * args.copies
+    print(f"{len(examples)} documents, {args.copies} copies")
+
+    measure(corpus, None)
+    measure(corpus, r4.InternTable(maxsize=args.maxsize))
+
+
+if __name__ == "__main__":
+    main()
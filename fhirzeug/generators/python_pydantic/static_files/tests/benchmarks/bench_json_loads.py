@@ -0,0 +1,41 @@
+"""Benchmark JSON decoding on the example corpus.
+
+Compare the strict `r4.json_loads` (exact decimals, duplicate keys rejected) with
+the plain `json.loads` and with the whole `r4.from_raw` ingest path.
+
+Usage: python tests/benchmarks/bench_json_loads.py [--number N]
+"""
+import argparse
+import json
+import timeit
+from pathlib import Path
+
+from pydantic_fhir import r4
+
+EXAMPLES_ROOT = Path(__file__).parent.parent.joinpath("test_examples", "examples")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=5, help="runs over the corpus")
+    args = parser.parse_args()
+
+    corpus = [path.read_text() for path in sorted(EXAMPLES_ROOT.glob("*.json"))]
+    size = sum(len(raw) for raw in corpus)
+    print(f"{len(corpus)} documents, {size / 1e6:.2f} MB, {args.number} runs")
+
+    candidates = {
+        "json.loads": json.loads,
+        "r4.json_loads": r4.json_loads,
+        "r4.from_raw": r4.from_raw,
+    }
+    for name, loads in candidates.items():
+        duration = timeit.timeit(
+            lambda loads=loads: [loads(raw) for raw in corpus], number=args.number
+        )
+        throughput = size * args.number / duration / 1e6
+        print(f"{name:>15}: {duration:.3f}s, {throughput:.2f} MB/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+"""Benchmark suite of the generated package.
+
+Measure, on the examples copied in `tests/test_examples/examples`:
+    - cold `import pydantic_fhir.r4` time and memory (RSS), in fresh interpreters,
+    - `r4.from_raw` and `.json()` throughput,
+    - memory retained per loaded resource.
+
+Results are written to a JSON report and compared against a stored baseline, a
+previous report. The exit status is 1 if a metric regressed by more than the
+tolerance, so that the suite can gate changes of the templates.
+
+Usage:
+    python tests/benchmarks/bench_suite.py [--output report.json]
+        [--baseline baseline.json] [--update-baseline] [--tolerance 0.2]
+"""
+import argparse
+import json
+import subprocess
+import sys
+import timeit
+import tracemalloc
+from pathlib import Path
+from typing import Dict, List
+
+from pydantic_fhir import r4
+
+BENCHMARKS_ROOT = Path(__file__).parent
+EXAMPLES_ROOT = BENCHMARKS_ROOT.parent.joinpath("test_examples", "examples")
+
+# Whether a lower or a higher value is better, for each metric of the report.
+METRICS = {
+    "import_time_s": "lower",
+    "import_rss_mb": "lower",
+    "from_raw_documents_per_s": "higher",
+    "from_raw_mb_per_s": "higher",
+    "json_documents_per_s": "higher",
+    "instance_memory_kb": "lower",
+}
+
+IMPORT_SCRIPT = """
+import json
+import resource
+import time
+
+start = time.perf_counter()
+import pydantic_fhir.r4
+duration = time.perf_counter() - start
+
+# On Linux, ru_maxrss is in kilobytes.
+rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(json.dumps({"duration": duration, "rss": rss}))
+"""
+
+
+def measure_import(runs: int) -> Dict[str, float]:
+    """Import `pydantic_fhir.r4` in fresh interpreters and keep the best run."""
+    results = []
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, "-c", IMPORT_SCRIPT],
+            check=True,
+            stdout=subprocess.PIPE,
+            universal_newlines=True,
+        ).stdout
+        results.append(json.loads(output))
+    return {
+        "import_time_s": min(result["duration"] for result in results),
+        "import_rss_mb": min(result["rss"] for result in results) / 1024,
+    }
+
+
+def measure_throughput(corpus: List[str], number: int) -> Dict[str, float]:
+    """Measure loading and serialization throughput over the corpus."""
+    size = sum(len(raw) for raw in corpus)
+    resources = [r4.from_raw(raw) for raw in corpus]
+
+    from_raw_duration = min(
+        timeit.repeat(lambda: [r4.from_raw(raw) for raw in corpus], number=number)
+    )
+    json_duration = min(
+        timeit.repeat(
+            lambda: [
+                resource.json(by_alias=True, exclude_none=True)
+                for resource in resources
+            ],
+            number=number,
+        )
+    )
+    return {
+        "from_raw_documents_per_s": len(corpus) * number / from_raw_duration,
+        "from_raw_mb_per_s": size * number / from_raw_duration / 1e6,
+        "json_documents_per_s": len(corpus) * number / json_duration,
+    }
+
+
+def measure_instance_memory(corpus: List[str]) -> Dict[str, float]:
+    """Measure the mean memory retained by a loaded resource."""
+    tracemalloc.start()
+    try:
+        start, _ = tracemalloc.get_traced_memory()
+        resources = [r4.from_raw(raw) for raw in corpus]
+        end, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del resources
+    return {"instance_memory_kb": (end - start) / len(corpus) / 1024}
+
+
+def compare(
+    report: Dict[str, float], baseline: Dict[str, float], tolerance: float
+) -> List[str]:
+    """Return the metrics of the report that regressed compared to the baseline."""
+    regressions = []
+    for metric, better in METRICS.items():
+        if metric not in baseline or not baseline[metric]:
+            continue
+        change = (report[metric] - baseline[metric]) / baseline[metric]
+        regression = change if better == "lower" else -change
+        status = "REGRESSION" if regression > tolerance else "ok"
+        print(f"{metric:>25}: {report[metric]:12.3f} ({change:+.1%}) {status}")
+        if regression > tolerance:
+            regressions.append(metric)
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--output", type=Path, help="path of the JSON report")
+    parser.add_argument(
+        "--baseline", type=Path, default=BENCHMARKS_ROOT.joinpath("baseline.json")
+    )
+    parser.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help="store the report as new baseline",
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.2,
+        help="allowed relative regression of each metric",
+    )
+    parser.add_argument("--number", type=int, default=5, help="runs over the corpus")
+    parser.add_argument("--import-runs", type=int, default=3)
+    args = parser.parse_args()
+
+    corpus = [path.read_text() for path in sorted(EXAMPLES_ROOT.glob("*.json"))]
+    report: Dict[str, float] = {}
+    report.update(measure_import(args.import_runs))
+    report.update(measure_throughput(corpus, args.number))
+    report.update(measure_instance_memory(corpus))
+
+    if args.output is not None:
+        args.output.write_text(json.dumps(report, indent=2, sort_keys=True))
+
+    if args.update_baseline:
+        args.baseline.write_text(json.dumps(report, indent=2, sort_keys=True))
+        print(f"Baseline stored in {args.baseline}")
+        return 0
+
+    if not args.baseline.exists():
+        print(json.dumps(report, indent=2, sort_keys=True))
+        print(f"No baseline found at {args.baseline}, use --update-baseline.")
+        return 0
+
+    baseline = json.loads(args.baseline.read_text())
+    regressions = compare(report, baseline, args.tolerance)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
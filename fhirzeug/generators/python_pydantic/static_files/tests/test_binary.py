@@ -0,0 +1,70 @@
+"""Test the binary encoding of resources."""
+import json
+from pathlib import Path
+
+import pytest
+
+from pydantic_fhir import r4
+
+EXAMPLES_ROOT = Path(__file__).parent.joinpath("test_examples", "examples")
+
+
+@pytest.mark.parametrize(
+    "path", sorted(EXAMPLES_ROOT.glob("*.json")), ids=lambda path: path.name
+)
+def test_binary_examples(path: Path):
+    resource = r4.from_raw(path.read_text())
+    decoded = r4.from_binary(r4.to_binary(resource))
+    assert type(decoded) is type(resource)
+    assert decoded == resource
+    assert decoded.fhir_json() == resource.fhir_json()
+
+
+def test_binary_lossless():
+    raw = json.dumps(
+        {
+            "resourceType": "Observation",
+            "status": "final",
+            "code": {"text": "Poids ⚖"},
+            "valueQuantity": {"value": 1.50, "unit": "kg"},
+            "contained": [
+                {
+                    "resourceType": "Patient",
+                    "name": [{"given": ["Jo", "J."], "_given": [None, {"id": "i"}]}],
+                    "multipleBirthInteger": -3,
+                }
+            ],
+        }
+    ).replace("1.5", "1.50")
+    observation = r4.from_raw(raw)
+    decoded = r4.from_binary(r4.to_binary(observation))
+
+    assert decoded == observation
+    assert str(decoded.value_quantity.value) == "1.50"
+    assert decoded.status is r4.ObservationStatus.final
+    assert decoded.contained[0].name[0].given__extension == [None, r4.Element(id="i")]
+    assert decoded.contained[0].multiple_birth_integer == -3
+    assert decoded.__fields_set__ == observation.__fields_set__
+    assert len(r4.to_binary(observation)) < len(observation.fhir_json())
+
+
+@pytest.mark.parametrize(
+    "data", [b"", b"{}", b"FHIRb\x01", b"FHIRb\x01\x06\x05Foo", b"FHIRb\x01\x09"],
+)
+def test_from_binary_invalid(data: bytes):
+    with pytest.raises(ValueError):
+        r4.from_binary(data)
+
+
+def test_from_binary_truncated():
+    data = r4.to_binary(r4.Patient(id="example", active=True))
+    for size in range(len(data)):
+        with pytest.raises(ValueError):
+            r4.from_binary(data[:size])
+    with pytest.raises(ValueError):
+        r4.from_binary(data + b"\x00")
+
+
+def test_to_binary_not_a_resource():
+    with pytest.raises(TypeError):
+        r4.to_binary(r4.HumanName(family="Doe"))
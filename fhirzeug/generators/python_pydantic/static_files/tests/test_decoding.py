@@ -0,0 +1,83 @@
+"""Test the iterative decoding of nested objects by `r4.from_dict`."""
+import pydantic
+import pytest
+
+from pydantic_fhir import r4
+
+
+def nested_questionnaire(depth: int) -> dict:
+    item = {"linkId": "0", "type": "group"}
+    root = item
+    for i in range(1, depth):
+        child = {"linkId": str(i), "type": "group"}
+        item["item"] = [child]
+        item = child
+    return {"resourceType": "Questionnaire", "status": "draft", "item": [root]}
+
+
+def test_decoding_table():
+    table = r4._get_decoding_table(r4.Patient)
+    assert table["active"] == r4.DecodingField("active", None, False, "_active")
+    assert table["_active"] == r4.DecodingField(
+        "active__extension", "PrimitiveExtension", False, "active"
+    )
+    assert table["name"] == r4.DecodingField("name", "HumanName", True)
+    # Inherited fields are merged, and can be looked up by field name.
+    assert table["id"] == r4.DecodingField("id", None, False, "_id")
+    assert table["implicit_rules"] is table["implicitRules"]
+
+
+@pytest.mark.parametrize("depth", [10, 500])
+def test_from_dict_deep_nesting(depth: int):
+    """Deeply nested objects do not hit the recursion limit."""
+    item = r4.from_dict(nested_questionnaire(depth)).item[0]
+    for _ in range(1, depth):
+        item = item.item[0]
+    assert item.link_id == str(depth - 1)
+    assert item.item is None
+
+
+def test_from_dict_does_not_mutate_input():
+    data = {"resourceType": "Patient", "name": [{}, {"given": ["a"]}]}
+    r4.from_dict(data)
+    assert data == {"resourceType": "Patient", "name": [{}, {"given": ["a"]}]}
+
+
+def test_from_dict_strips_empty_objects():
+    data = {
+        "resourceType": "Patient",
+        "name": [{}],
+        "meta": {"profile": []},
+        "contained": [{"resourceType": "Patient"}],
+    }
+    patient = r4.from_dict(data)
+    assert patient.name is None
+    assert patient.meta is None
+    assert patient.contained == [r4.Patient()]
+
+
+def test_from_dict_nested_errors():
+    """Errors of nested objects are reported at their location."""
+    data = {
+        "resourceType": "Patient",
+        "gender": "unknown-gender",
+        "name": [{"period": {"start": "not a date"}}],
+    }
+    with pytest.raises(pydantic.ValidationError) as exc_info:
+        r4.from_dict(data)
+    locs = [error["loc"] for error in exc_info.value.errors()]
+    assert ("resourceType", "gender") in locs
+    assert ("resourceType", "name", 0, "period", "start") in locs
+
+
+def test_constructor_copies_models():
+    coding = r4.Coding(system="http://loinc.org", code="1234-5")
+    concept = r4.CodeableConcept(coding=[coding])
+    assert concept.coding[0] == coding
+    assert concept.coding[0] is not coding
+
+    # Models given to `from_dict` are copied as well.
+    name = r4.HumanName(given=["a"])
+    patient = r4.from_dict({"resourceType": "Patient", "name": [name]})
+    assert patient.name[0] == name
+    assert patient.name[0] is not name
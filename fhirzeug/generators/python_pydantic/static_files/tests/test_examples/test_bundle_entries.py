@@ -0,0 +1,88 @@
+"""Test the lazy iteration over Bundle entries."""
+import io
+import json
+from pathlib import Path
+
+import pydantic
+import pytest
+
+from pydantic_fhir import r4
+
+BUNDLE = {
+    "resourceType": "Bundle",
+    "type": "collection",
+    "total": 1234567890,
+    "entry": [
+        {"resource": {"resourceType": "Patient", "id": "p1"}},
+        {"fullUrl": "urn:uuid:1", "resource": {"resourceType": "Organization"}},
+        {"resource": {"resourceType": "Patient", "id": "p2", "active": True}},
+    ],
+}
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 65536])
+def test_iter_bundle_entries_examples(fhir_file: Path, chunk_size: int):
+    """Entries are the same as when loading the whole Bundle."""
+    doc = json.loads(fhir_file.read_text())
+    if doc["resourceType"] != "Bundle":
+        pytest.skip("not a Bundle")
+
+    with fhir_file.open("rb") as f_in:
+        entries = list(r4.iter_bundle_entries(f_in, chunk_size=chunk_size))
+
+    assert entries == (r4.from_dict(doc).entry or [])
+
+
+@pytest.mark.parametrize(
+    "raw", [json.dumps(BUNDLE), json.dumps(BUNDLE, indent=4), json.dumps(BUNDLE)[:-1]]
+)
+def test_iter_bundle_entries(raw: str):
+    bundle = r4.from_dict(BUNDLE)
+    stream = io.StringIO(raw)
+    if raw.endswith("}"):
+        assert list(r4.iter_bundle_entries(stream, chunk_size=5)) == bundle.entry
+    else:
+        with pytest.raises(pydantic.ValidationError):
+            list(r4.iter_bundle_entries(stream, chunk_size=5))
+
+
+def test_iter_bundle_entries_is_lazy():
+    raw = json.dumps(BUNDLE).encode()
+    stream = io.BytesIO(raw)
+    entries = r4.iter_bundle_entries(stream, chunk_size=16)
+    assert next(entries).resource == r4.Patient(id="p1")
+    assert stream.tell() < len(raw)
+
+
+@pytest.mark.parametrize(
+    "bundle,loc",
+    [
+        ({"resourceType": "Patient", "entry": []}, ("JSON decoding",)),
+        ({"type": "collection", "entry": []}, ("JSON decoding",)),
+        ({"resourceType": "Bundle", "entry": [{}, "x"]}, ("entry", 1)),
+        (
+            {"resourceType": "Bundle", "entry": [{"resource": {"foo": "bar"}}]},
+            ("entry", 0, "resource", "resourceType"),
+        ),
+        ({"resourceType": "Bundle", "type": "unknown"}, ("type",)),
+    ],
+)
+def test_iter_bundle_entries_invalid(bundle: dict, loc: tuple):
+    with pytest.raises(pydantic.ValidationError) as exc_info:
+        list(r4.iter_bundle_entries(io.StringIO(json.dumps(bundle))))
+    assert exc_info.value.errors()[0]["loc"] == loc
+
+
+@pytest.mark.parametrize(
+    "raw",
+    [
+        '{"resourceType": "Bundle", "resourceType": "Bundle"}',
+        '{"resourceType": "Bundle", "entry": [], "entry": []}',
+        '{"resourceType": "Bundle", "entry": [{"fullUrl": "a", "fullUrl": "b"}]}',
+        '{"resourceType": "Bundle"} {}',
+    ],
+)
+def test_iter_bundle_entries_invalid_json(raw: str):
+    with pytest.raises(pydantic.ValidationError) as exc_info:
+        list(r4.iter_bundle_entries(io.StringIO(raw)))
+    assert exc_info.value.errors()[0]["loc"] == ("JSON decoding",)
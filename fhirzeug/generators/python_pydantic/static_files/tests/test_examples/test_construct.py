@@ -0,0 +1,55 @@
+"""Test the trusted construction of resources on all examples."""
+import json
+from pathlib import Path
+
+import pytest
+
+from pydantic_fhir import r4
+
+
+def test_construct_from_dict(fhir_file: Path):
+    """A constructed resource equals the validated one."""
+    resource = r4.from_dict(json.loads(fhir_file.read_text()))
+    json_str = resource.json(by_alias=True, exclude_unset=True)
+
+    constructed = r4.construct_from_dict(r4.json_loads(json_str))
+
+    assert type(constructed) is type(resource)
+    assert constructed == resource
+    assert constructed.json(by_alias=True, exclude_unset=True) == json_str
+    assert constructed.json(by_alias=True, exclude_none=True) == resource.json(
+        by_alias=True, exclude_none=True
+    )
+
+
+def test_construct_from_dict_nested_classes():
+    constructed = r4.construct_from_dict(
+        {
+            "resourceType": "Bundle",
+            "type": "collection",
+            "entry": [
+                {"resource": {"resourceType": "Patient", "birthDate": "2000-01-01"}},
+                {"resource": {"resourceType": "Organization", "_name": {"id": "x"}}},
+            ],
+        }
+    )
+    assert constructed.type is r4.BundleType.collection
+    assert isinstance(constructed.entry[0], r4.BundleEntry)
+    assert isinstance(constructed.entry[0].resource, r4.Patient)
+    assert constructed.entry[0].resource.birth_date == "2000-01-01"
+    assert constructed.entry[0].resource.gender is None
+    assert isinstance(constructed.entry[1].resource.name__extension, r4.Element)
+
+
+@pytest.mark.parametrize(
+    "dict_",
+    [
+        {"id": "x"},
+        {"resourceType": "FooBar"},
+        {"resourceType": "Patient", "foo": "bar"},
+        {"resourceType": "Bundle", "entry": [{"resource": {"id": "x"}}]},
+    ],
+)
+def test_construct_from_dict_invalid(dict_: dict):
+    with pytest.raises(ValueError):
+        r4.construct_from_dict(dict_)
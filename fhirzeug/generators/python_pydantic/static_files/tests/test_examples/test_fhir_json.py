@@ -0,0 +1,71 @@
+"""Test the single pass FHIR JSON serialization on all examples."""
+import json
+from pathlib import Path
+
+import pydantic
+
+from pydantic_fhir import r4
+
+
+def pydantic_json(model: pydantic.BaseModel, **kwargs) -> str:
+    """Serialize `.dict()` as `pydantic.BaseModel.json` does."""
+    return r4.json_dumps(
+        model.dict(by_alias=True, exclude_none=True),
+        default=pydantic.json.pydantic_encoder,
+        **kwargs,
+    )
+
+
+def test_fhir_json(fhir_file: Path):
+    resource = r4.from_dict(json.loads(fhir_file.read_text()))
+    assert resource.fhir_json() == pydantic_json(resource)
+    assert resource.json(by_alias=True, exclude_none=True) == resource.fhir_json()
+
+
+def test_fhir_json_empty_items():
+    """Items emptied after validation are omitted, as by `.dict()`."""
+    patient = r4.Patient(
+        active=True,
+        gender="female",
+        name=[{"family": "Doe", "given": ["John", "J."]}, {"text": "x"}],
+        birthDate="2000-01-01",
+        _birthDate={"id": "birth"},
+        deceasedBoolean=False,
+    )
+    patient.name[0].family = "  "
+    patient.name[1].text = ""
+    patient.name[0].given__extension = [None, r4.Element(id="initial")]
+    patient.id = "\tpatient "
+
+    assert patient.fhir_json() == pydantic_json(patient)
+    assert json.loads(patient.fhir_json()) == {
+        "resourceType": "Patient",
+        "id": "patient",
+        "active": True,
+        "name": [{"given": ["John", "J."], "_given": [None, {"id": "initial"}]}],
+        "gender": "female",
+        "birthDate": "2000-01-01",
+        "_birthDate": {"id": "birth"},
+        "deceasedBoolean": False,
+    }
+
+    assert patient.json(by_alias=True, exclude_none=True) == patient.fhir_json()
+    # Formatting arguments do not change the items.
+    assert patient.json(by_alias=True, exclude_none=True, indent=2) == pydantic_json(
+        patient, indent=2
+    )
+    assert json.loads(patient.json(by_alias=True, indent=2)) == json.loads(
+        patient.fhir_json()
+    )
+
+    assert r4.Patient().fhir_json() == pydantic_json(r4.Patient())
+    assert r4.Element().fhir_json() == "{}"
+
+
+def test_fhir_json_decimals():
+    observation = r4.from_raw(
+        '{"resourceType": "Observation", "status": "final", "code": {"text": "é"},'
+        ' "valueQuantity": {"value": 1.50, "unit": "kg"}}'
+    )
+    assert observation.fhir_json() == pydantic_json(observation)
+    assert '"value": 1.50' in observation.fhir_json()
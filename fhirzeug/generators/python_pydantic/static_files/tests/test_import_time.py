@@ -0,0 +1,44 @@
+"""Test the time needed to import `pydantic_fhir.r4`."""
+import json
+import subprocess
+import sys
+
+# Import time budget, in seconds, for the whole R4 specification.
+IMPORT_TIME_BUDGET = 5.0
+
+IMPORT_SCRIPT = """
+import json
+import time
+
+start = time.perf_counter()
+from pydantic_fhir import r4
+duration = time.perf_counter() - start
+
+resolved = [
+    name
+    for name, resource in r4.RESOURCE_TYPE_MAP.items()
+    if "_forward_refs_resolved" in resource.__dict__
+]
+print(json.dumps({"duration": duration, "resolved": resolved}))
+"""
+
+
+def _import_in_new_process() -> dict:
+    output = subprocess.run(
+        [sys.executable, "-c", IMPORT_SCRIPT],
+        check=True,
+        stdout=subprocess.PIPE,
+        universal_newlines=True,
+    ).stdout
+    return json.loads(output)
+
+
+def test_import_time():
+    """Import is within budget, the best of three runs is kept to reduce noise."""
+    durations = [_import_in_new_process()["duration"] for _ in range(3)]
+    assert min(durations) < IMPORT_TIME_BUDGET
+
+
+def test_forward_refs_resolved_lazily():
+    """No forward reference is resolved at import, only on first validation."""
+    assert _import_in_new_process()["resolved"] == []
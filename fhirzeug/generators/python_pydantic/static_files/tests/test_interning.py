@@ -0,0 +1,69 @@
+"""Test the interning of repeated values by `r4.from_dict`."""
+import json
+
+from pydantic_fhir import r4
+
+CODING = {"system": "http://loinc.org", "code": "8867-4", "display": "Heart rate"}
+
+
+def observation(value: int = 60) -> dict:
+    return {
+        "resourceType": "Observation",
+        "status": "final",
+        "code": {"coding": [CODING], "text": "Heart rate"},
+        "valueQuantity": {"value": value, "unit": "beats/minute"},
+    }
+
+
+def test_from_dict_intern():
+    table = r4.InternTable()
+    first = r4.from_dict(observation(), intern=table)
+    second = r4.from_dict(observation(), intern=table)
+
+    assert first == second
+    assert second.code is first.code
+    assert second.code.coding[0] is first.code.coding[0]
+    assert second.value_quantity is first.value_quantity
+    assert table.hits == 3
+    assert len(table) == 3
+
+
+def test_from_dict_without_intern():
+    first = r4.from_dict(observation())
+    second = r4.from_dict(observation())
+    assert second.code is not first.code
+
+
+def test_intern_by_serialized_content():
+    table = r4.InternTable()
+    raw = json.dumps(observation())
+    first = r4.from_raw(raw.replace("60", "60.0"), intern=table)
+    second = r4.from_raw(raw.replace("60", "60.00"), intern=table)
+    assert second.value_quantity is not first.value_quantity
+    assert second.code is first.code
+
+    other = dict(CODING, userSelected=True)
+    third = r4.from_dict(
+        dict(observation(), code={"coding": [other], "text": "Heart rate"}),
+        intern=table,
+    )
+    assert third.code is not first.code
+    assert third.value_quantity is not first.value_quantity
+
+
+def test_intern_table_is_bounded():
+    table = r4.InternTable(maxsize=2, classes=[r4.Coding])
+    for code in ["a", "b", "c"]:
+        r4.from_dict(
+            {
+                "resourceType": "Observation",
+                "status": "final",
+                "code": {"coding": [{"code": code}]},
+            },
+            intern=table,
+        )
+    assert len(table) == 2
+    assert table.misses == 3
+    table.clear()
+    assert len(table) == 0
+    assert table.hits == table.misses == 0
@@ -0,0 +1,63 @@
+import io
+from pathlib import Path
+
+import pytest
+
+from pydantic_fhir import r4
+
+LINES = [
+    '{"resourceType": "Patient", "id": "p1"}',
+    '{"resourceType": "Patient", "id": "p2", "gender": "unknown-value"}',
+    "",
+    '{"resourceType": "Patient", "id": "p3"',
+    '{"resourceType": "Organization", "id": "o1", "name": "ACME"}',
+    "42",
+    '{"resourceType": "Patient", "id": "p4"}',
+]
+
+
+def _check_lines(results):
+    results = sorted(results, key=lambda result: result.line_number)
+    assert [result.line_number for result in results] == [1, 2, 4, 5, 6, 7]
+
+    loaded = {result.line_number: result.resource for result in results}
+    assert loaded[1] == r4.Patient(id="p1")
+    assert loaded[5] == r4.Organization(id="o1", name="ACME")
+    assert loaded[7] == r4.Patient(id="p4")
+
+    errors = {result.line_number: result.errors for result in results}
+    for line_number in (2, 4, 6):
+        assert loaded[line_number] is None
+        assert errors[line_number]
+    assert errors[4][0]["loc"] == ("JSON decoding",)
+    assert errors[6][0]["loc"] == ("resourceType",)
+
+
+def test_from_ndjson_text_stream():
+    _check_lines(r4.from_ndjson(io.StringIO("\n".join(LINES))))
+
+
+def test_from_ndjson_path(tmp_path: Path):
+    path = tmp_path / "Patient.ndjson"
+    path.write_text("\n".join(LINES))
+    _check_lines(r4.from_ndjson(path))
+    _check_lines(r4.from_ndjson(str(path)))
+
+
+def test_from_ndjson_is_lazy():
+    stream = io.BytesIO("\n".join(LINES).encode())
+    results = r4.from_ndjson(stream)
+    assert next(results).resource == r4.Patient(id="p1")
+    assert stream.tell() < len(stream.getvalue())
+
+
+@pytest.mark.parametrize("ordered", [True, False])
+def test_from_ndjson_process_pool(ordered: bool):
+    stream = io.BytesIO("\n".join(LINES * 10).encode())
+    results = list(r4.from_ndjson(stream, processes=2, ordered=ordered, batch_size=3))
+    assert len(results) == 60
+    if ordered:
+        line_numbers = [result.line_number for result in results]
+        assert line_numbers == sorted(line_numbers)
+
+    _check_lines(result for result in results if result.line_number <= len(LINES))
@@ -0,0 +1,67 @@
+"""Test the projection of resources on requested elements at load time."""
+import json
+
+import pydantic
+import pytest
+
+from pydantic_fhir import r4
+
+OBSERVATION = {
+    "resourceType": "Observation",
+    "id": "example",
+    "meta": {"versionId": "1"},
+    "status": "final",
+    "_status": {"id": "status"},
+    "code": {"text": "Heart rate"},
+    "subject": {"reference": "Patient/1"},
+    "effectiveDateTime": "2020-01-01",
+    "_effectiveDateTime": {"id": "effective"},
+    "valueQuantity": {"value": 60, "unit": "beats/minute"},
+}
+
+
+def test_from_dict_elements():
+    observation = r4.from_dict(OBSERVATION, elements=["id", "meta"])
+    # Mandatory elements are kept, with the extensions of their values.
+    assert observation == r4.Observation(
+        id="example",
+        meta={"versionId": "1"},
+        status="final",
+        _status={"id": "status"},
+        code={"text": "Heart rate"},
+    )
+
+
+@pytest.mark.parametrize(
+    "elements", [["effectiveDateTime"], ["effective"], ["effective[x]"]]
+)
+def test_from_dict_elements_choice_of_type(elements: list):
+    observation = r4.from_dict(OBSERVATION, elements=elements)
+    assert observation.effective_date_time == "2020-01-01"
+    assert observation.effective_date_time__extension == r4.Element(id="effective")
+    assert observation.value_quantity is None
+    assert observation.subject is None
+
+
+def test_from_raw_elements():
+    raw = json.dumps(OBSERVATION)
+    assert r4.from_raw(raw, elements=["subject"]) == r4.from_dict(
+        OBSERVATION, elements=["subject"]
+    )
+
+
+def test_from_dict_elements_not_validated():
+    """Elements which are not requested are neither validated nor loaded."""
+    data = dict(OBSERVATION, subject={"reference": 1}, foo="bar")
+    assert r4.from_dict(data, elements=["id"]).id == "example"
+    with pytest.raises(pydantic.ValidationError):
+        r4.from_dict(data, elements=["subject"])
+
+
+def test_from_dict_elements_mandatory():
+    """Mandatory elements are still validated."""
+    data = {key: value for key, value in OBSERVATION.items() if key != "status"}
+    with pytest.raises(pydantic.ValidationError):
+        r4.from_dict(data, elements=["id"])
+    with pytest.raises(pydantic.ValidationError):
+        r4.from_dict(dict(OBSERVATION, code={"coding": "not a list"}), elements=["id"])
@@ -0,0 +1,96 @@
+"""Test that unmodified objects loaded with `keep_raw` are written as loaded."""
+import json
+
+import pytest
+
+from pydantic_fhir import r4
+
+RAW = """{
+  "resourceType": "Patient",
+  "id": "example",
+  "active": true,
+  "name": [
+    {"family": "Doe",   "given": ["John", "J."]},
+    {"text": "Johnny"}
+  ],
+  "gender": "male",
+  "managingOrganization": {"reference": "Organization/1"}
+}"""
+
+
+def test_keep_raw_unmodified():
+    patient = r4.from_raw(RAW, keep_raw=True)
+    assert patient == r4.from_raw(RAW)
+    assert patient.fhir_json(reuse_raw=True) == RAW
+    assert r4.from_raw(RAW.encode(), keep_raw=True).fhir_json(reuse_raw=True) == RAW
+
+
+def test_keep_raw_disabled():
+    patient = r4.from_raw(RAW)
+    assert patient.fhir_json(reuse_raw=True) != RAW
+    assert json.loads(patient.fhir_json(reuse_raw=True)) == json.loads(RAW)
+
+
+def test_keep_raw_not_reused_by_default():
+    """Only `fhir_json(reuse_raw=True)` writes the raw JSON."""
+    patient = r4.from_raw(RAW, keep_raw=True)
+    expected = r4.from_raw(RAW).fhir_json()
+    assert patient.fhir_json() == expected
+    assert patient.json(by_alias=True, exclude_none=True) == expected
+    assert (
+        patient.json(by_alias=True, exclude_none=True, indent=None, sort_keys=False)
+        == expected
+    )
+
+
+def deactivate(patient: r4.Patient) -> None:
+    patient.active = False
+
+
+def rename(patient: r4.Patient) -> None:
+    patient.name[0].family = "Smith"
+
+
+def add_given(patient: r4.Patient) -> None:
+    patient.name[0].given.append("Jr.")
+
+
+def remove_name(patient: r4.Patient) -> None:
+    patient.name.pop()
+
+
+def add_display(patient: r4.Patient) -> None:
+    patient.managing_organization.display = "Acme"
+
+
+@pytest.mark.parametrize(
+    "modify", [deactivate, rename, add_given, remove_name, add_display]
+)
+def test_keep_raw_modified(modify):
+    patient = r4.from_raw(RAW, keep_raw=True)
+    expected = r4.from_raw(RAW)
+    modify(patient)
+    modify(expected)
+
+    assert patient.fhir_json(reuse_raw=True) != RAW
+    assert json.loads(patient.fhir_json(reuse_raw=True)) == json.loads(
+        expected.fhir_json()
+    )
+    # Unmodified objects are still written as loaded.
+    if patient.name[-1].text == "Johnny":
+        assert '{"text": "Johnny"}' in patient.fhir_json(reuse_raw=True)
+
+
+def test_keep_raw_normalized_values():
+    """Objects changed by validation are serialized again."""
+    raw = '{"resourceType": "Patient", "name": [{"family": " Doe", "given": []}]}'
+    patient = r4.from_raw(raw, keep_raw=True)
+    assert patient.fhir_json(reuse_raw=True) == r4.from_raw(raw).fhir_json()
+    assert patient.fhir_json(reuse_raw=True) == (
+        '{"resourceType": "Patient", "name": [{"family": "Doe"}]}'
+    )
+
+
+def test_keep_raw_json_loads_arguments():
+    with pytest.raises(TypeError):
+        r4.from_raw(RAW, keep_raw=True, parse_int=float)
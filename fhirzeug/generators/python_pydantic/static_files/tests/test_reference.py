@@ -60,3 +60,42 @@ def test_reference_validator(values: typing.Dict, is_valid: bool) -> None:
     else:
         with pytest.raises(ValueError):
             r4._reference_validator(values)
+
+
+@pytest.mark.parametrize(
+    ("reference", "expected"),
+    [
+        ("Patient/23", (None, "Patient", "23", None)),
+        ("Patient/23/_history/2", (None, "Patient", "23", "2")),
+        (
+            "http://fhir.example.org/fhir/Patient/23",
+            ("fhir.example.org/fhir/", "Patient", "23", None),
+        ),
+        (
+            "https://example.org/Group/23/_history/a.1",
+            ("example.org/", "Group", "23", "a.1"),
+        ),
+        (
+            "http://example.org/Patient/Group/1",
+            ("example.org/Patient/", "Group", "1", None),
+        ),
+        ("http://example.org/Patient/Foo/1", None),
+        ("Foo/23", None),
+        ("MetadataResource/23", None),
+        ("Patient/23/_history", None),
+        ("Patient/", None),
+        ("#foobar", None),
+        (None, None),
+    ],
+)
+def test_parse_literal_reference(
+    reference: typing.Optional[str], expected: typing.Optional[typing.Tuple]
+) -> None:
+    parsed = r4.parse_literal_reference(reference)
+    if expected is None:
+        assert parsed is None
+    else:
+        assert parsed == r4.ParsedLiteralReference(*expected)
+        assert parsed.resource_type == expected[1]
+        # Parsed references are cached.
+        assert r4.parse_literal_reference(reference) is parsed
@@ -0,0 +1,98 @@
+"""Test the serialization of summaries."""
+import json
+
+import pytest
+
+from pydantic_fhir import r4
+
+PATIENT = {
+    "resourceType": "Patient",
+    "id": "example",
+    "text": {"status": "generated", "div": "<div>Peter</div>"},
+    "active": True,
+    "name": [{"family": "Chalmers", "given": ["Peter"]}],
+    "birthDate": "1974-12-25",
+    "_birthDate": {"id": "birth"},
+    "contact": [{"name": {"family": "Du Marché"}}],
+}
+
+SUMMARY = {
+    "resourceType": "Patient",
+    "id": "example",
+    "active": True,
+    "name": [{"family": "Chalmers", "given": ["Peter"]}],
+    "birthDate": "1974-12-25",
+    "_birthDate": {"id": "birth"},
+}
+
+
+def test_summary_fields():
+    fields = r4._get_summary_fields(r4.Patient)
+    assert {"resource_type", "id", "meta", "name", "birth_date__extension"} <= fields
+    assert "text" not in fields
+    assert "contact" not in fields
+    # Data types are summarized too, the extensions of primitive values are not.
+    assert "extension" not in r4._get_summary_fields(r4.HumanName)
+    assert r4._get_summary_fields(r4.PrimitiveExtension) is None
+
+
+def test_summary():
+    patient = r4.from_dict(PATIENT)
+    assert json.loads(patient.fhir_json(summary=True)) == SUMMARY
+    assert patient.json(by_alias=True, exclude_none=True, summary=True) == (
+        patient.fhir_json(summary=True)
+    )
+    assert json.loads(patient.json(by_alias=True, summary=True, indent=2)) == SUMMARY
+    assert patient.dict(by_alias=True, summary=True) == SUMMARY
+    assert patient.dict(summary=True)["birth_date"] == "1974-12-25"
+    assert "contact" in patient.dict()
+
+
+def test_summary_of_bundle():
+    """Resources of the entries are summarized."""
+    bundle = r4.from_dict(
+        {
+            "resourceType": "Bundle",
+            "type": "searchset",
+            "entry": [{"resource": PATIENT}],
+        }
+    )
+    summary = bundle.dict(by_alias=True, summary=True)
+    assert summary["entry"][0]["resource"] == SUMMARY
+    assert json.loads(bundle.fhir_json(summary=True)) == summary
+
+
+def test_summary_of_data_type():
+    """Elements of data types that are not marked as summary are left out."""
+    attachment = r4.Attachment(
+        contentType="text/plain", data="aGVsbG8=", title="Greeting"
+    )
+    summary = {"contentType": "text/plain", "title": "Greeting"}
+    assert attachment.dict(by_alias=True, summary=True) == summary
+    assert json.loads(attachment.fhir_json(summary=True)) == summary
+    assert attachment.dict(by_alias=True)["data"] == "aGVsbG8="
+
+    patient = r4.from_dict(
+        {
+            "resourceType": "Patient",
+            "name": [
+                {
+                    "family": "Chalmers",
+                    "extension": [{"url": "http://example.org", "valueString": "a"}],
+                }
+            ],
+        }
+    )
+    summary = {"resourceType": "Patient", "name": [{"family": "Chalmers"}]}
+    assert patient.dict(by_alias=True, summary=True) == summary
+    assert json.loads(patient.fhir_json(summary=True)) == summary
+
+
+def test_summary_with_include():
+    with pytest.raises(ValueError):
+        r4.from_dict(PATIENT).dict(summary=True, include={"id"})
+
+
+def test_summary_of_raw_resource():
+    patient = r4.from_raw(json.dumps(PATIENT), keep_raw=True)
+    assert json.loads(patient.fhir_json(summary=True)) == SUMMARY
@@ -0,0 +1,109 @@
+"""Test the opt-in cache of validated nested objects."""
+import concurrent.futures
+
+import pydantic
+import pytest
+
+from pydantic_fhir import r4
+
+REFERENCE = {"reference": "Practitioner/123", "display": "Dr. Doe"}
+
+
+def observation(reference: dict = REFERENCE) -> dict:
+    return {
+        "resourceType": "Observation",
+        "status": "final",
+        "code": {"text": "Heart rate"},
+        "performer": [reference, reference],
+    }
+
+
+@pytest.fixture
+def cache():
+    yield r4.FHIRAbstractBase.enable_validation_cache(maxsize=2, classes=[r4.Reference])
+    r4.FHIRAbstractBase.disable_validation_cache()
+
+
+def test_validation_cache_disabled():
+    assert r4.FHIRAbstractBase.validation_cache_info() is None
+
+
+def test_validation_cache(cache):
+    first = r4.from_dict(observation())
+    assert r4.FHIRAbstractBase.validation_cache_info() == (1, 1, 2, 1)
+
+    second = r4.from_dict(observation(dict(reversed(list(REFERENCE.items())))))
+    assert r4.FHIRAbstractBase.validation_cache_info() == (3, 1, 2, 1)
+    assert second == first == r4.from_dict(observation())
+
+    # Copies of the cached model are returned.
+    assert second.performer[0] is not first.performer[0]
+    second.performer[0].display = "changed"
+    assert r4.from_dict(observation()).performer[0].display == "Dr. Doe"
+
+
+def test_validation_cache_deep_copies():
+    r4.FHIRAbstractBase.enable_validation_cache()
+    try:
+        dict_ = {
+            "resourceType": "Observation",
+            "status": "final",
+            "meta": {"profile": ["http://a"]},
+            "code": {"coding": [{"system": "http://loinc.org", "code": "1-8"}]},
+            "performer": [REFERENCE, REFERENCE],
+        }
+        first = r4.from_dict(dict_)
+        first.code.coding[0].code = "MUTATED"
+        first.meta.profile.append("http://b")
+        first.performer[0].display = "changed"
+
+        second = r4.from_dict(dict_)
+        assert second.code.coding[0].code == "1-8"
+        assert second.meta.profile == ["http://a"]
+        assert [performer.display for performer in second.performer] == [
+            "Dr. Doe",
+            "Dr. Doe",
+        ]
+        # Duplicates within a document do not share their nested models either.
+        second.performer[0].display = "changed"
+        assert second.performer[1].display == "Dr. Doe"
+    finally:
+        r4.FHIRAbstractBase.disable_validation_cache()
+
+
+def test_validation_cache_pydantic_validation(cache):
+    r4.Observation(**observation())
+    r4.Observation(**observation())
+    assert r4.FHIRAbstractBase.validation_cache_info() == (3, 1, 2, 1)
+
+
+def test_validation_cache_is_bounded(cache):
+    for i in range(3):
+        r4.from_dict(observation({"reference": f"Practitioner/{i}"}))
+    info = r4.FHIRAbstractBase.validation_cache_info()
+    assert info.currsize == 2
+    assert info.misses == 3
+
+    cache.clear()
+    assert r4.FHIRAbstractBase.validation_cache_info() == (0, 0, 2, 0)
+
+
+def test_validation_cache_threads(cache):
+    def load(i: int) -> r4.Observation:
+        return r4.from_dict(observation({"reference": f"Practitioner/{i % 3}"}))
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+        observations = list(executor.map(load, range(200)))
+    assert observations == [load(i) for i in range(200)]
+    info = r4.FHIRAbstractBase.validation_cache_info()
+    # Each observation looks its two equal references up.
+    assert info.hits + info.misses == 2 * 400
+    assert info.currsize == 2
+
+
+def test_validation_cache_invalid(cache):
+    invalid = observation({"reference": 1234, "foo": "bar"})
+    for _ in range(2):
+        with pytest.raises(pydantic.ValidationError):
+            r4.from_dict(invalid)
+    assert r4.FHIRAbstractBase.validation_cache_info().currsize == 0
@@ -15,18 +15,20 @@ def exact_regex_constr(**kwargs):
 FHIRString = pydantic.constr(strip_whitespace=True)
 FHIRRequiredString = pydantic.constr(min_length=1, strip_whitespace=True)
 
+# Date and time patterns of the FHIR specification, rewritten with non-capturing
+# groups and a single range check for years, as they run on every timestamp.
+_YEAR = r"[0-9]{4}(?<!0000)"
+_MONTH = r"(?:0[1-9]|1[0-2])"
+_DAY = r"(?:0[1-9]|[1-2][0-9]|3[0-1])"
+_TIME = r"(?:[01][0-9]|2[0-3]):[0-5][0-9]:(?:[0-5][0-9]|60)(?:\.[0-9]+)?"
+_TIMEZONE = r"(?:Z|[+-](?:(?:0[0-9]|1[0-3]):[0-5][0-9]|14:00))"
+
 FHIRDateTime = exact_regex_constr(
-    regex=r"([0-9]([0-9]([0-9][1-9]|[1-9]0)|[1-9]00)|[1-9]000)(-(0[1-9]|1[0-2])(-(0[1-9]|[1-2][0-9]|3[0-1])(T([01][0-9]|2[0-3]):[0-5][0-9]:([0-5][0-9]|60)(\.[0-9]+)?(Z|(\+|-)((0[0-9]|1[0-3]):[0-5][0-9]|14:00)))?)?)?"
-)
-FHIRDate = exact_regex_constr(
-    regex=r"([0-9]([0-9]([0-9][1-9]|[1-9]0)|[1-9]00)|[1-9]000)(-(0[1-9]|1[0-2])(-(0[1-9]|[1-2][0-9]|3[0-1]))?)?"
-)
-FHIRInstant = exact_regex_constr(
-    regex=r"([0-9]([0-9]([0-9][1-9]|[1-9]0)|[1-9]00)|[1-9]000)-(0[1-9]|1[0-2])-(0[1-9]|[1-2][0-9]|3[0-1])T([01][0-9]|2[0-3]):[0-5][0-9]:([0-5][0-9]|60)(\.[0-9]+)?(Z|(\+|-)((0[0-9]|1[0-3]):[0-5][0-9]|14:00))"
-)
-FHIRTime = exact_regex_constr(
-    regex=r"([01][0-9]|2[0-3]):[0-5][0-9]:([0-5][0-9]|60)(\.[0-9]+)?"
+    regex=rf"{_YEAR}(?:-{_MONTH}(?:-{_DAY}(?:T{_TIME}{_TIMEZONE})?)?)?"
 )
+FHIRDate = exact_regex_constr(regex=rf"{_YEAR}(?:-{_MONTH}(?:-{_DAY})?)?")
+FHIRInstant = exact_regex_constr(regex=rf"{_YEAR}-{_MONTH}-{_DAY}T{_TIME}{_TIMEZONE}")
+FHIRTime = exact_regex_constr(regex=_TIME)
 FHIRCode = exact_regex_constr(regex=r"[^\s]+(\s[^\s]+)*")
 
 FHIROid = exact_regex_constr(regex=r"urn:oid:[0-2](\.(0|[1-9][0-9]*))+")
@@ -37,10 +39,12 @@ FHIRBase64Binary = exact_regex_constr(regex=r"(\s*([0-9a-zA-Z\+/=]){4}\s*)+")
 
 
 def validate_factory(cls):
+    regex = re.compile(exact_regex(cls.REGEX))
+
     def validate_int_string(v):
         """Validate a string given a FHIR regex."""
         if isinstance(v, str):
-            if re.match(exact_regex(cls.REGEX), v) is None:
+            if regex.match(v) is None:
                 msg = f"String does not match {cls.__name__} pattern : {cls.REGEX}"
                 raise ValueError(msg)
             return int(v)
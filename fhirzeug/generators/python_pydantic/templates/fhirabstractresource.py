@@ -5,5 +5,5 @@ class FHIRAbstractResource(FHIRAbstractBase):
 
     resource_type: typing.Literal["FHIRAbstractResource"] = "FHIRAbstractResource"
 
-
-# Empty comment to avoid bad concatenation
+    class Config:
+        fields = {"resource_type": "resourceType"}
@@ -1,66 +1,54 @@
 # Define custom root validators.
 # Validators are added to the already defined Resources in resource_footer.py .
 
-import re  # noqa: F811
 import typing
 import pydantic
 
 
-def _build_fhir_api_regex() -> re.Pattern:
-
-    _all_resources_names = set()
-
-    def _add_subresources(_resource: typing.Type[Resource]) -> None:
-        _subresources = _resource.__subclasses__()
-        if len(_subresources) == 0:
-            _all_resources_names.add(_resource.__name__)
-        else:
-            for _subresource in _subresources:
-                _add_subresources(_subresource)
-
-    _add_subresources(Resource)
+def _build_fhir_resource_names() -> typing.FrozenSet[str]:
+    """Return the names of the concrete resources, from RESOURCE_TYPE_MAP."""
     _resources_to_ignore = {"MetadataResource", "Parameters"}
-    for _resource_name in _resources_to_ignore:
-        _all_resources_names.remove(_resource_name)
-
-    resources_pattern = "|".join(sorted(_all_resources_names))
-
-    return re.compile(
-        # Taken from https://www.hl7.org/fhir/references.html#literal
-        r"\A"
-        # From https://www.hl7.org/fhir/http.html#root : "The protocols http: and https:
-        # SHALL NOT be used to refer to different underlying objects" -> we do not take it
-        # in base_url group.
-        r"((http|https):\/\/(?P<base_url>([A-Za-z0-9\-\\\.\:\%\$]*\/)+))?"
-        r"(?P<resource_type>(" + resources_pattern + r"))\/"
-        r"(?P<resource_id>[A-Za-z0-9\-\.]{1,64})"
-        r"(\/_history\/(?P<version>[A-Za-z0-9\-\.]{1,64}))?"
-        r"\Z"
+    return frozenset(
+        _resource_name
+        for _resource_name, _resource in RESOURCE_TYPE_MAP.items()
+        if len(_resource.__subclasses__()) == 0
+        and _resource_name not in _resources_to_ignore
     )
 
 
-_FHIR_API_REGEX = _build_fhir_api_regex()
+_FHIR_RESOURCE_NAMES = _build_fhir_resource_names()
 
+_FHIR_API_REGEX = re.compile(
+    # Taken from https://www.hl7.org/fhir/references.html#literal
+    r"\A"
+    # From https://www.hl7.org/fhir/http.html#root : "The protocols http: and https:
+    # SHALL NOT be used to refer to different underlying objects" -> we do not take it
+    # in base_url group.
+    r"(?:(?:http|https):\/\/(?P<base_url>(?:[A-Za-z0-9\-\\\.\:\%\$]*\/)+))?"
+    # Resource type is checked against _FHIR_RESOURCE_NAMES once matched.
+    r"(?P<resource_type>[A-Za-z]+)\/"
+    r"(?P<resource_id>[A-Za-z0-9\-\.]{1,64})"
+    r"(?:\/_history\/(?P<version>[A-Za-z0-9\-\.]{1,64}))?"
+    r"\Z"
+)
 
-class _ParsedLiteralReference(pydantic.BaseModel):
+# References are often repeated, e.g. across the entries of a Bundle.
+_REFERENCE_CACHE_SIZE = 4096
+
+
+class ParsedLiteralReference(typing.NamedTuple):
     """An object containing data parsed from a literal reference with known pattern."""
 
-    base_url: typing.Optional[str] = None
+    base_url: typing.Optional[str]
     resource_type: str
     resource_id: str
-    version: typing.Optional[str] = None
-
-    @pydantic.validator("base_url")
-    def base_url_to_none(cls, v: str) -> typing.Optional[str]:
-        """Convert base_url to None if it's an empty url."""
-        if not v:
-            return None
-        return v
+    version: typing.Optional[str]
 
 
-def _parse_literal_reference(
+@functools.lru_cache(maxsize=_REFERENCE_CACHE_SIZE)
+def parse_literal_reference(
     reference: typing.Optional[str],
-) -> typing.Optional[_ParsedLiteralReference]:
+) -> typing.Optional[ParsedLiteralReference]:
     """Try to parse a reference as if the resource is server by a FHIR API server.
 
     Warnings :
@@ -70,15 +58,31 @@ def _parse_literal_reference(
     """
     if reference is not None:
         match = _FHIR_API_REGEX.match(reference)
-        if match is not None:
-            return _ParsedLiteralReference(**match.groupdict())
+        if match is not None and match.group("resource_type") in _FHIR_RESOURCE_NAMES:
+            # An empty base_url is converted to None.
+            return ParsedLiteralReference(
+                match.group("base_url") or None,
+                match.group("resource_type"),
+                match.group("resource_id"),
+                match.group("version"),
+            )
     return None
 
 
-class _AnyAbsoluteUrl(pydantic.BaseModel):
-    """Validator used to test if a string is an absolute URL."""
+_ABSOLUTE_URL_FIELD = pydantic.fields.ModelField.infer(
+    name="reference",
+    value=pydantic.fields.Required,
+    annotation=pydantic.AnyUrl,
+    class_validators=None,
+    config=pydantic.BaseConfig,
+)
 
-    url: pydantic.AnyUrl
+
+@functools.lru_cache(maxsize=_REFERENCE_CACHE_SIZE)
+def _is_absolute_url(reference: str) -> bool:
+    """Test if a string is an absolute URL."""
+    _, errors = _ABSOLUTE_URL_FIELD.validate(reference, {}, loc="reference")
+    return errors is None
 
 
 def _reference_validator(values):
@@ -86,7 +90,7 @@ def _reference_validator(values):
     resource_type = values.get("type")
     reference = values.get("reference")
     if reference is not None:
-        parsed_literal_reference = _parse_literal_reference(reference)
+        parsed_literal_reference = parse_literal_reference(reference)
         if parsed_literal_reference is not None:
             if (
                 resource_type is not None
@@ -98,18 +102,21 @@ def _reference_validator(values):
         elif reference.startswith("#"):
             # Reference is an internal fragment reference referring to contained resources.
             pass
-        else:
-            try:
-                _AnyAbsoluteUrl(url=reference)
-            except pydantic.ValidationError:
-                # Reference is neither an absolute URL nor an URL relative to a FHIR
-                # RESTful server with pattern "TYPE/ID".
-                raise ValueError(
-                    "Reference must be an absolute URL or an URL relative to a FHIR RESTful server"
-                )
+        elif not _is_absolute_url(reference):
+            # Reference is neither an absolute URL nor an URL relative to a FHIR
+            # RESTful server with pattern "TYPE/ID".
+            raise ValueError(
+                "Reference must be an absolute URL or an URL relative to a FHIR RESTful server"
+            )
     return values
 
 
+# Fields of the value[x] choice of Extension, with their primitive extensions.
+_EXTENSION_VALUE_FIELDS = tuple(
+    name for name in Extension.__fields__ if name.startswith("value_")
+)
+
+
 def _extension_element_validator(values):
     """Validate extension element values.
 
@@ -120,9 +127,8 @@ def _extension_element_validator(values):
     """
     err_msg = "An extension SHALL have either a value or sub-extensions, but not both."
     if values.get("extension") is not None:
-        for key, value in values.items():
-            if key.startswith("value_"):
-                assert value is None, err_msg
+        for name in _EXTENSION_VALUE_FIELDS:
+            assert values.get(name) is None, err_msg
     return values
 
 
@@ -1,6 +1,16 @@
+import codecs
+import collections
+import concurrent.futures
 import enum
 import decimal
+import functools
+import itertools
+import operator
+import os
+import re
+import secrets
 import stringcase
+import threading
 import typing
 from collections.abc import Mapping
 import json
@@ -13,32 +23,108 @@ import pydantic
 # However, in pydantic fields beginning with an underscore are ignored by default.
 # As a workaround, we set an alias for primitive fields extensions by removing the
 # underscore prefix and adding a `__extension` suffix to the extension name.
-# See method `primitive_extension_alias_generator` below.
+# Generated classes declare their aliases statically in `Config.fields`.
+# Other models fall back on `alias_generator` below.
 _EXTENSION_SUFFIX = "__extension"
 
 
-def choice_of_validator(choices, optional):
-    def check_at_least_one(cls, values):
+class DecodingField(typing.NamedTuple):
+    """How to decode the JSON value of a field, see `_decode` in the footer.
 
-        setted_values = len(
-            set(k for k, v in values.items() if v is not None) & choices
-        )
-        if setted_values > 1:
-            raise ValueError(f"Only one of the fields is allowed to be set ({choices})")
-        elif not optional and setted_values < 1:
-            raise ValueError(f"At least one of the fields needs to be set ({choices})")
+    Each generated class declares a table of its own fields by JSON name.
+    """
+
+    # Name of the field.
+    name: str
+    # Class of the values if they are JSON objects, None for JSON primitive values.
+    type_name: typing.Optional[str]
+    # Whether the field is an array.
+    is_array: bool
+    # JSON name of the other field of a primitive value and its extension.
+    extension_partner: typing.Optional[str] = None
+    # Name of the choice of type, e.g. `value` for `value[x]`.
+    choice_group: typing.Optional[str] = None
+    # Whether the element is mandatory, at least one of a mandatory choice of type.
+    required: bool = False
+
+
+def choice_of_types_validator(
+    groups: typing.Dict[str, typing.Tuple[typing.Set[str], bool]]
+) -> typing.Callable:
+    """Build a root validator checking all the choices of type of a class.
+
+    `groups` maps the name of each choice, e.g. `value` for `value[x]`, to the
+    field names of its types and whether the choice is optional. The values are
+    walked once for all the groups.
+
+    The errors of all the groups are reported together, each located at the name
+    of its group when there are several.
+    """
+    group_of_field = {
+        field: group for group, (choices, _) in groups.items() for field in choices
+    }
+    required = [
+        (group, choices) for group, (choices, optional) in groups.items() if not optional
+    ]
+
+    def check_choices_of_type(cls, values):
+        setted_groups = set()
+        errors: typing.Dict[str, str] = {}
+        for key, value in values.items():
+            if value is not None and key in group_of_field:
+                group = group_of_field[key]
+                if group in setted_groups:
+                    choices = groups[group][0]
+                    errors[group] = (
+                        f"Only one of the fields is allowed to be set ({choices})"
+                    )
+                setted_groups.add(group)
+        for group, choices in required:
+            if group not in setted_groups:
+                errors[group] = (
+                    f"At least one of the fields needs to be set ({choices})"
+                )
+        if len(errors) == 1:
+            raise ValueError(*errors.values())
+        if errors:
+            raise pydantic.ValidationError(
+                [
+                    pydantic.error_wrappers.ErrorWrapper(ValueError(message), loc=group)
+                    for group, message in errors.items()
+                ],
+                cls,
+            )
         return values
 
-    return check_at_least_one
+    return check_choices_of_type
 
 
-def get_primitive_field_root_validator(field_name: str) -> classmethod:
-    """Build a root validator that validates a primitive field.
+def choice_of_validator(choices, optional):
+    return choice_of_types_validator({"": (choices, optional)})
+
+
+def get_primitive_fields_root_validator(
+    primitive_fields: typing.Dict[str, typing.Tuple[str, str]]
+) -> classmethod:
+    """Build a root validator that validates all primitive fields of a class.
+
+    `primitive_fields` is a static table generated for each class. It maps every
+    JSON-primitive field name to its alias and to the alias of its extension.
+    Example: `{"birth_date": ("birthDate", "_birthDate")}`.
+
+    Only the extensions actually present in the input are looked at, so the cost
+    of the validator depends on the provided fields, not on the declared ones.
 
     Root validator is used in order to have access to all other (already validated)
     fields. `skip_on_failure` is set in order to avoid validating fields that
     might not be cleaned.
     """
+    # Extension can either be present as the real extension name or its alias.
+    # Both are mapped to the real field name and its alias.
+    extension_keys: typing.Dict[str, typing.Tuple[str, str]] = {}
+    for field_name, (field_alias, extension_alias) in primitive_fields.items():
+        extension_keys[field_name + _EXTENSION_SUFFIX] = (field_name, field_alias)
+        extension_keys[extension_alias] = (field_name, field_alias)
 
     @pydantic.root_validator(pre=True, skip_on_failure=True, allow_reuse=True)
     def _validator(
@@ -48,38 +134,43 @@ def get_primitive_field_root_validator(field_name: str) -> classmethod:
         # If field or extension is not set, we do not need to validate the consistency
         # between them.
         # Note: that might not be the case anymore when we will also validate cardinality.
-
-        # Field can either be present as the real field name or its alias
-        inner_field_name = field_name
-        if inner_field_name not in values:
-            inner_field_name = alias_generator(inner_field_name)
+        present_extensions = [key for key in values if key in extension_keys]
+        for extension_name in present_extensions:
+            # Field can either be present as the real field name or its alias
+            inner_field_name, field_alias = extension_keys[extension_name]
             if inner_field_name not in values:
-                return values
-
-        # Extension can either be present as the real extension name or its alias
-        extension_name = field_name + _EXTENSION_SUFFIX
-        if extension_name not in values:
-            extension_name = alias_generator(extension_name)
-            if extension_name not in values:
-                return values
-
-        # Get field and extension values
-        field_value = values[inner_field_name]
-        extension_value = values[extension_name]
-
-        # Validate them and get validated values
-        validated_field_value, validated_extension_value = _validate_primitive_field(
-            field_value, extension_value
-        )
+                inner_field_name = field_alias
+                if inner_field_name not in values:
+                    continue
+
+            # Validate field and extension values and get validated values
+            validated_field_value, validated_extension_value = _validate_primitive_field(
+                values[inner_field_name], values[extension_name]
+            )
 
-        # Assign new values and return
-        values[inner_field_name] = validated_field_value
-        values[extension_name] = validated_extension_value
+            # Assign new values
+            values[inner_field_name] = validated_field_value
+            values[extension_name] = validated_extension_value
         return values
 
     return _validator
 
 
+def get_primitive_field_root_validator(field_name: str) -> classmethod:
+    """Build a root validator that validates a single primitive field.
+
+    Kept for backward compatibility, see `get_primitive_fields_root_validator`.
+    """
+    return get_primitive_fields_root_validator(
+        {
+            field_name: (
+                alias_generator(field_name),
+                alias_generator(field_name + _EXTENSION_SUFFIX),
+            )
+        }
+    )
+
+
 def _validate_primitive_field(
     initial_field_value: typing.Any, extension_field_value: typing.Any
 ) -> typing.Tuple[typing.Any, typing.Any]:
@@ -227,21 +318,48 @@ class DocEnum(enum.Enum):
         return obj
 
 
+_DECIMAL_PLACEHOLDER = f"__decimal_{secrets.token_hex(8)}_"
+_DECIMAL_PLACEHOLDER_REGEX = re.compile(f'"{_DECIMAL_PLACEHOLDER}([0-9]+)"')
+
+
 class DecimalEncoder(json.JSONEncoder):
-    def encode(self, obj):
-        if isinstance(obj, Mapping):
-            return (
-                "{"
-                + ", ".join(
-                    f"{self.encode(k)}: {self.encode(v)}" for (k, v) in obj.items()
-                )
-                + "}"
-            )
-        if isinstance(obj, typing.Iterable) and (not isinstance(obj, str)):
-            return "[" + ", ".join(map(self.encode, obj)) + "]"
-        if isinstance(obj, decimal.Decimal):
-            return str(obj)
-        return super().encode(obj)
+    """JSON encoder writing `decimal.Decimal` values losslessly.
+
+    The encoding itself is done by the standard library (its C implementation when
+    available). Each decimal is first replaced by a placeholder string, unique to the
+    process, which is then substituted by the exact decimal representation.
+    """
+
+    def iterencode(self, o, _one_shot=False):
+        decimals: typing.List[str] = []
+        placeholder = _DECIMAL_PLACEHOLDER
+        pattern = _DECIMAL_PLACEHOLDER_REGEX
+        default = self.default
+
+        def _default(obj):
+            if isinstance(obj, decimal.Decimal):
+                decimals.append(str(obj))
+                return placeholder + str(len(decimals) - 1)
+            if isinstance(obj, Mapping):
+                return dict(obj)
+            if isinstance(obj, typing.Iterable) and (not isinstance(obj, str)):
+                return list(obj)
+            return default(obj)
+
+        def _substitute(match: typing.Match) -> str:
+            return decimals[int(match.group(1))]
+
+        self.default = _default
+        try:
+            chunks = super().iterencode(o, _one_shot=_one_shot)
+        finally:
+            # The encoder reads `self.default` when built, it can be restored now.
+            self.default = default
+
+        for chunk in chunks:
+            if decimals:
+                chunk = pattern.sub(_substitute, chunk)
+            yield chunk
 
 
 def check_for_duplicate_keys(
@@ -252,14 +370,16 @@ def check_for_duplicate_keys(
     Raise ValueError if a duplicate key exists in provided ordered
     list of pairs, otherwise return a dict.
 
-    Taken from https://stackoverflow.com/a/49518779/2750114 .
+    The dict is built natively and its length compared to the number of pairs. The
+    pairs are only iterated in Python to report the duplicated key.
     """
-    dict_out: typing.Dict = {}
-    for key, val in ordered_pairs:
-        if key in dict_out:
-            raise ValueError(f"Duplicate key: {key}")
-        else:
-            dict_out[key] = val
+    dict_out = dict(ordered_pairs)
+    if len(dict_out) != len(ordered_pairs):
+        seen: typing.Set[typing.Hashable] = set()
+        for key, _ in ordered_pairs:
+            if key in seen:
+                raise ValueError(f"Duplicate key: {key}")
+            seen.add(key)
     return dict_out
 
 
@@ -267,13 +387,123 @@ def json_dumps(*args, **kwargs):
     return json.dumps(*args, **kwargs, cls=DecimalEncoder)
 
 
-def json_loads(*args, **kwargs):
-    return json.loads(
-        *args,
-        **kwargs,
-        parse_float=decimal.Decimal,
-        object_pairs_hook=check_for_duplicate_keys,
-    )
+def json_dump(obj: typing.Any, fp: typing.TextIO, **kwargs) -> None:
+    """Serialize `obj` as JSON into a writable text buffer.
+
+    Output is the same as `json_dumps`. Chunks are written to `fp` as they are
+    produced by the encoder instead of being joined first.
+    """
+    for chunk in DecimalEncoder(**kwargs).iterencode(obj, _one_shot=True):
+        fp.write(chunk)
+
+
+def json_dumpb(obj: typing.Any, default: typing.Optional[typing.Callable] = None) -> bytes:
+    """Serialize `obj` as compact UTF-8 encoded JSON.
+
+    If `orjson` (>= 3.9) is installed, it is used as a faster backend. Otherwise,
+    the standard library encoder is used. Both backends agree on the documents
+    produced by `FHIRAbstractBase.dict()`, but not on arbitrary values: orjson
+    writes floats as `1e16` instead of `1e+16`, rejects integers that do not fit
+    in 64 bits and serializes datetime, enum and dataclass values natively.
+
+    `FHIRAbstractBase.json()` does not use this function.
+    """
+    if _orjson_dumps is not None:
+        return _orjson_dumps(obj, default=default)
+    return json.dumps(
+        obj,
+        cls=DecimalEncoder,
+        default=default,
+        separators=(",", ":"),
+        ensure_ascii=False,
+    ).encode("utf-8")
+
+
+def _build_orjson_dumps() -> typing.Optional[typing.Callable[..., bytes]]:
+    """Return a serializer based on `orjson` if a compatible version is installed."""
+    try:
+        import orjson  # type: ignore
+    except ImportError:
+        return None
+    if not hasattr(orjson, "Fragment"):
+        # `orjson.Fragment` is required to write decimals losslessly.
+        return None
+
+    def _orjson_dumps(
+        obj: typing.Any, default: typing.Optional[typing.Callable] = None
+    ) -> bytes:
+        def _default(value):
+            if isinstance(value, decimal.Decimal):
+                return orjson.Fragment(str(value))
+            if isinstance(value, Mapping):
+                return dict(value)
+            if isinstance(value, typing.Iterable) and (not isinstance(value, str)):
+                return list(value)
+            if default is not None:
+                return default(value)
+            raise TypeError(
+                f"Object of type {value.__class__.__name__} is not JSON serializable"
+            )
+
+        return orjson.dumps(obj, default=_default, option=orjson.OPT_NON_STR_KEYS)
+
+    return _orjson_dumps
+
+
+_orjson_dumps = _build_orjson_dumps()
+
+
+_json_decoder = json.JSONDecoder(
+    parse_float=decimal.Decimal, object_pairs_hook=check_for_duplicate_keys
+)
+
+
+def json_loads(s: typing.Union[str, bytes, bytearray], **kwargs):
+    """Deserialize a JSON document, keeping decimals exact.
+
+    Raise ValueError if an object of the document contains a duplicated key.
+    """
+    if kwargs:
+        return json.loads(
+            s,
+            **kwargs,
+            parse_float=decimal.Decimal,
+            object_pairs_hook=check_for_duplicate_keys,
+        )
+    if isinstance(s, (bytes, bytearray)):
+        s = s.decode(json.detect_encoding(s), "surrogatepass")
+    # Reuse a single decoder instead of building one per call as `json.loads` does.
+    return _json_decoder.decode(s)
+
+
+# Arguments of `pydantic.BaseModel.json` given to `.dict()`.
+_DICT_ARGUMENTS = (
+    "include",
+    "exclude",
+    "by_alias",
+    "skip_defaults",
+    "exclude_unset",
+    "exclude_defaults",
+    "exclude_none",
+)
+
+
+class _DecodedModels(threading.local):
+    """Models validated by the running `_decode` call of the thread, by id.
+
+    Their parent uses them as they are, instead of the copy that pydantic makes of
+    a model given to a constructor.
+    """
+
+    def __init__(self) -> None:
+        self.models: typing.Dict[int, "FHIRAbstractBase"] = {}
+
+
+_decoded_models = _DecodedModels()
+
+
+# Dynamic validators of each class, including the ones of its parents.
+_DYNAMIC_VALIDATORS: typing.Dict[type, typing.Tuple[typing.Callable, ...]] = {}
 
 
 class FHIRAbstractBase(pydantic.BaseModel):
@@ -284,10 +514,130 @@ class FHIRAbstractBase(pydantic.BaseModel):
         """ Profiles this resource claims to conform to.
         List of `str` items. """
 
-    def dict(self, *args, **kwargs):
+    # Text of the model in the JSON it was loaded from, see `from_raw(keep_raw=True)`.
+    __slots__ = ("_fhir_raw",)
+
+    # Opt-in cache of validated models, see `enable_validation_cache`.
+    _validation_cache: typing.ClassVar[typing.Optional["ValidationCache"]] = None
+
+    def __init__(__pydantic_self__, **data: typing.Any) -> None:
+        __pydantic_self__.__class__._resolve_forward_refs()
+        super().__init__(**data)
+
+    @classmethod
+    def _resolve_forward_refs(cls) -> None:
+        """Resolve forward references of the class on its first validation.
+
+        This is done lazily, class by class, instead of for all classes at import.
+        """
+        if "_forward_refs_resolved" not in cls.__dict__:
+            try:
+                cls.update_forward_refs()
+            except NameError:
+                # Unresolved fields are reported by pydantic when validated.
+                pass
+            cls._forward_refs_resolved = True
+
+    @classmethod
+    def schema(cls, *args, **kwargs) -> typing.Dict[str, typing.Any]:
+        # Nested classes are not validated, resolve forward references of all classes.
+        classes = [FHIRAbstractBase]
+        while classes:
+            subclass = classes.pop()
+            subclass._resolve_forward_refs()
+            classes.extend(subclass.__subclasses__())
+        return super().schema(*args, **kwargs)
+
+    @classmethod
+    def validate(cls, value: typing.Any):
+        # Children validated first by `_decode` are used as they are.
+        if id(value) in _decoded_models.models and isinstance(value, cls):
+            return value
+        cache = FHIRAbstractBase._validation_cache
+        key = cache.key(cls, value) if cache is not None else None
+        if key is None:
+            return super().validate(value)
+        model = cache.get(key)
+        if model is None:
+            model = super().validate(value)
+            cache.put(key, model)
+        return model
+
+    @classmethod
+    def enable_validation_cache(
+        cls, maxsize: int = 4096, classes: typing.Optional[typing.Iterable] = None
+    ) -> "ValidationCache":
+        """Cache the validation of nested objects of all FHIR classes.
+
+        The models validated from objects of `classes` (immutable datatypes such as
+        Coding, Extension, Meta or Reference by default) are kept in a bounded LRU
+        cache, by content. Validating an equal object again returns a copy of the
+        cached model. Statistics are returned by `validation_cache_info`.
+        """
+        FHIRAbstractBase._validation_cache = ValidationCache(maxsize, classes)
+        return FHIRAbstractBase._validation_cache
+
+    @classmethod
+    def disable_validation_cache(cls) -> None:
+        FHIRAbstractBase._validation_cache = None
+
+    @classmethod
+    def validation_cache_info(cls) -> typing.Optional["ValidationCacheInfo"]:
+        """Return the statistics of the validation cache, None if disabled."""
+        cache = FHIRAbstractBase._validation_cache
+        return cache.info() if cache is not None else None
+
+    def dict(self, *args, summary: bool = False, **kwargs):
+        """Serialize the model as a dictionary, without its empty items.
+
+        With `summary`, only the elements of resources and backbone elements marked
+        as summary in the specification, and the mandatory ones, are kept.
+        """
+        if summary:
+            kwargs["include"] = _summary_include(self, kwargs.get("include"))
         serialized = super().dict(*args, **kwargs)
         return _without_empty_items(serialized) or {}
 
+    def json(
+        self,
+        *,
+        summary: bool = False,
+        encoder: typing.Optional[typing.Callable[[typing.Any], typing.Any]] = None,
+        **kwargs,
+    ) -> str:
+        """Serialize the model as JSON, from `.dict()` without its empty items.
+
+        Arguments are as for `pydantic.BaseModel.json`: the ones of `.dict()` select
+        the items, the other ones are given to `json.dumps`.
+        """
+        dict_kwargs = {key: kwargs.pop(key) for key in _DICT_ARGUMENTS if key in kwargs}
+        if (
+            not kwargs
+            and encoder is None
+            and dict_kwargs == {"by_alias": True, "exclude_none": True}
+        ):
+            # Same output, written in a single pass.
+            return self.fhir_json(summary=summary)
+        serialized = self.dict(summary=summary, **dict_kwargs)
+        return self.__config__.json_dumps(
+            serialized, default=encoder or self.__json_encoder__, **kwargs
+        )
+
+    def fhir_json(self, summary: bool = False, reuse_raw: bool = False) -> str:
+        """Serialize the model as FHIR JSON.
+
+        The output is the same as `.json(by_alias=True, exclude_none=True)`, but the
+        model is walked once and written directly, without building dictionaries.
+        `summary` is as for `.dict()`.
+
+        With `reuse_raw`, unmodified objects loaded by `from_raw(keep_raw=True)` are
+        written as they were in the raw JSON instead, formatting included.
+        """
+        chunks: typing.List[str] = []
+        if not _write_fhir_json(self, chunks, {} if reuse_raw else None, summary):
+            return "{}"
+        return "".join(chunks)
+
     @pydantic.root_validator(pre=True)
     def strip_empty_items(cls, values: typing.Dict) -> typing.Dict:
         """This strips all empty elements according to the fhir spec."""
@@ -327,22 +677,29 @@ class FHIRAbstractBase(pydantic.BaseModel):
         dynamic_validators = getattr(cls, dynamic_validators_field, [])
         dynamic_validators.append(validator)
         setattr(cls, dynamic_validators_field, dynamic_validators)
+        # Subclasses inherit the validator, the lists are computed again.
+        _DYNAMIC_VALIDATORS.clear()
 
     @classmethod
     def _dynamic_validators(
         cls,
-    ) -> typing.Generator[typing.Callable[[typing.Dict], typing.Dict], None, None]:
-        """Return a generator iterating over dynamic validators."""
-        for subclass in cls.__mro__:
-            if issubclass(subclass, FHIRAbstractBase):
+    ) -> typing.Tuple[typing.Callable[[typing.Dict], typing.Dict], ...]:
+        """Return the dynamic validators of the class and its parents.
+
+        The validators are collected over the __mro__ once per class.
+        """
+        validators = _DYNAMIC_VALIDATORS.get(cls)
+        if validators is None:
+            collected: typing.List[typing.Callable[[typing.Dict], typing.Dict]] = []
+            for subclass in cls.__mro__:
+                if not issubclass(subclass, FHIRAbstractBase):
+                    # If here, it means we are already in the parents' classes of
+                    # FHIRAbstractBase. We do not need to continue to iterate.
+                    break
                 subclass_field = subclass._get_dynamic_validators_field_name()
-                subclass_validators = getattr(subclass, subclass_field, None)
-                if subclass_validators is not None:
-                    yield from subclass_validators
-            else:
-                # If here, it means we are already in the parents' classes of FHIRAbstractBase
-                # We do not need to continue to iterate
-                return
+                collected.extend(getattr(subclass, subclass_field, None) or [])
+            validators = _DYNAMIC_VALIDATORS[cls] = tuple(collected)
+        return validators
 
     @classmethod
     def _get_dynamic_validators_field_name(cls) -> str:
@@ -382,6 +739,216 @@ class FHIRAbstractBase(pydantic.BaseModel):
         json_loads = json_loads
 
 
+# Fields of each class written by `fhir_json`: name, JSON key and the name of the
+# other field of a primitive value and its extension.
+_FHIR_JSON_TABLES: typing.Dict[
+    type, typing.Tuple[typing.Tuple[str, str, typing.Optional[str]], ...]
+] = {}
+
+_encode_json_string = json.encoder.encode_basestring_ascii  # type: ignore
+
+
+# Fields of each class kept in summaries, None if all fields are kept.
+_SUMMARY_FIELDS: typing.Dict[type, typing.Optional[typing.FrozenSet[str]]] = {}
+
+
+def _get_summary_fields(
+    cls: typing.Type[FHIRAbstractBase],
+) -> typing.Optional[typing.FrozenSet[str]]:
+    """Return the fields of a class kept in summaries, None to keep all of them.
+
+    Resources, backbone elements and data types are summarized by the summary
+    flags of their elements. The extensions of primitive values are kept whole.
+    """
+    if cls not in _SUMMARY_FIELDS:
+        fields = None
+        if hasattr(cls, "_summary_fields") and not issubclass(cls, PrimitiveExtension):
+            fields = frozenset(["resource_type"]).union(
+                *(klass.__dict__.get("_summary_fields", ()) for klass in cls.__mro__)
+            )
+        _SUMMARY_FIELDS[cls] = fields
+    return _SUMMARY_FIELDS[cls]
+
+
+def _summary_include(model: FHIRAbstractBase, include: typing.Any = None) -> typing.Any:
+    """Return the `include` argument of pydantic to serialize a summary of a model."""
+    if include is not None:
+        raise ValueError("A summary cannot be restricted to included fields.")
+    summary_fields = _get_summary_fields(type(model))
+    if summary_fields is None:
+        return ...
+    result: typing.Dict[str, typing.Any] = {}
+    for name, value in model.__dict__.items():
+        if value is None or name not in summary_fields:
+            continue
+        if isinstance(value, FHIRAbstractBase):
+            result[name] = _summary_include(value)
+        elif isinstance(value, list):
+            result[name] = {
+                index: _summary_include(item)
+                if isinstance(item, FHIRAbstractBase)
+                else ...
+                for index, item in enumerate(value)
+            }
+        else:
+            result[name] = ...
+    return result
+
+
+class RawSpan(typing.NamedTuple):
+    """Where a model is written in the JSON text it was loaded from.
+
+    The values of the fields when loaded, the items of their lists and the child
+    models are kept to find out whether the model has been modified since.
+    """
+
+    text: str
+    start: int
+    end: int
+    values: typing.Tuple[typing.Any, ...]
+    lists: typing.Tuple[typing.Tuple[list, typing.Tuple[typing.Any, ...]], ...]
+    children: typing.Tuple[FHIRAbstractBase, ...]
+
+
+def _is_unmodified(model: FHIRAbstractBase, memo: typing.Dict[int, bool]) -> bool:
+    """Test if a model and its children still match their raw JSON text."""
+    unmodified = memo.get(id(model))
+    if unmodified is None:
+        raw = getattr(model, "_fhir_raw", None)
+        unmodified = (
+            raw is not None
+            and all(map(operator.is_, model.__dict__.values(), raw.values))
+            and all(
+                len(values) == len(items) and all(map(operator.is_, values, items))
+                for values, items in raw.lists
+            )
+            and all(_is_unmodified(child, memo) for child in raw.children)
+        )
+        memo[id(model)] = unmodified
+    return unmodified
+
+
+def _get_fhir_json_table(
+    cls: typing.Type[FHIRAbstractBase],
+) -> typing.Tuple[typing.Tuple[str, str, typing.Optional[str]], ...]:
+    table = _FHIR_JSON_TABLES.get(cls)
+    if table is None:
+        fields = cls.__fields__
+        entries = []
+        for field in fields.values():
+            if field.name.endswith(_EXTENSION_SUFFIX):
+                partner = field.name[: -len(_EXTENSION_SUFFIX)]
+            else:
+                partner = field.name + _EXTENSION_SUFFIX
+            entries.append(
+                (
+                    field.name,
+                    _encode_json_string(field.alias) + ": ",
+                    partner if partner in fields else None,
+                )
+            )
+        table = _FHIR_JSON_TABLES[cls] = tuple(entries)
+    return table
+
+
+def _write_fhir_json(
+    value: typing.Any,
+    chunks: typing.List[str],
+    memo: typing.Optional[typing.Dict[int, bool]],
+    summary: bool = False,
+) -> bool:
+    """Append the JSON of a value to `chunks`, as `json_dumps(_without_empty_items())`.
+
+    Return False, with `chunks` unchanged, if the value is empty. `memo` caches
+    which models are unmodified since loaded, see `_is_unmodified`, the raw JSON
+    of the models is not reused if it is None. With `summary`, only the summary
+    fields of the models are written.
+    """
+    if isinstance(value, str):
+        # Also writes the value of string enums.
+        value = value.strip()
+        if not value:
+            return False
+        chunks.append(_encode_json_string(value))
+    elif isinstance(value, FHIRAbstractBase):
+        summary_fields = _get_summary_fields(type(value)) if summary else None
+        raw = getattr(value, "_fhir_raw", None) if memo is not None else None
+        if raw is not None and summary_fields is None and _is_unmodified(value, memo):
+            chunks.append(raw.text[raw.start : raw.end])
+            return True
+        start = len(chunks)
+        chunks.append("{")
+        separator = ""
+        values = value.__dict__
+        for name, key, partner in _get_fhir_json_table(type(value)):
+            item = values[name]
+            if item is None or (
+                summary_fields is not None and name not in summary_fields
+            ):
+                continue
+            mark = len(chunks)
+            chunks.append(separator + key)
+            if (
+                partner is not None
+                and isinstance(item, list)
+                and isinstance(values[partner], list)
+            ):
+                # Lists of primitive values and their extensions keep their null
+                # items, so that both stay aligned.
+                _write_fhir_json_list(item, chunks, memo, summary, keep_empty=True)
+            elif not _write_fhir_json(item, chunks, memo, summary):
+                del chunks[mark:]
+                continue
+            separator = ", "
+        if not separator:
+            del chunks[start:]
+            return False
+        chunks.append("}")
+    elif isinstance(value, (list, tuple)):
+        return _write_fhir_json_list(value, chunks, memo, summary, keep_empty=False)
+    elif value is None:
+        return False
+    elif value is True:
+        chunks.append("true")
+    elif value is False:
+        chunks.append("false")
+    elif isinstance(value, int):
+        chunks.append(int.__repr__(value))
+    elif isinstance(value, decimal.Decimal):
+        chunks.append(str(value))
+    elif isinstance(value, enum.Enum):
+        return _write_fhir_json(value.value, chunks, memo, summary)
+    else:
+        chunks.append(json_dumps(value, default=pydantic.json.pydantic_encoder))
+    return True
+
+
+def _write_fhir_json_list(
+    items: typing.Iterable[typing.Any],
+    chunks: typing.List[str],
+    memo: typing.Optional[typing.Dict[int, bool]],
+    summary: bool,
+    keep_empty: bool,
+) -> bool:
+    start = len(chunks)
+    chunks.append("[")
+    separator = ""
+    for item in items:
+        mark = len(chunks)
+        chunks.append(separator)
+        if not _write_fhir_json(item, chunks, memo, summary):
+            if not keep_empty:
+                del chunks[mark:]
+                continue
+            chunks.append("null")
+        separator = ", "
+    if not separator and not keep_empty:
+        del chunks[start:]
+        return False
+    chunks.append("]")
+    return True
+
+
 def _without_empty_items(obj: typing.Any):
     """Clean empty items.
 
@@ -0,0 +1,101 @@
+"""Test Reference element."""
+import pytest
+import pydantic
+import typing
+
+from pydantic_fhir import r4
+
+
+@pytest.mark.parametrize(
+    ("reference", "good_type", "wrong_type"),
+    [
+        ("Patient/23", "Patient", "Device"),
+        ("Group/23", "Group", "Patient"),
+        ("http://fhir.example.org/Patient/23", "Patient", "Device"),
+        ("https://another-example.org/Group/23", "Group", "Patient"),
+    ],
+)
+def test_resource_type_consistency(
+    reference: str, good_type: str, wrong_type: str
+) -> None:
+    """Test resource types must match within Reference."""
+    r4.Reference(reference=reference, type=good_type)
+    with pytest.raises(pydantic.ValidationError):
+        r4.Reference(reference=reference, type=wrong_type)
+
+
+def test_absolute_reference_not_url() -> None:
+    """Test reference must be a url if not REST format."""
+    r4.Reference(reference="http://fhir.example.org/Patient/23")
+    r4.Reference(reference="https://example.org/foobar")
+    r4.Reference(reference="ftp://ftp-server.com/foobar/example-0.1")
+
+    with pytest.raises(pydantic.ValidationError):
+        r4.Reference(reference="foobar")
+
+    with pytest.raises(pydantic.ValidationError):
+        r4.Reference(reference="foobar/23")  # foobar is not a resource type
+
+
+@pytest.mark.parametrize(
+    ("values", "is_valid"),
+    [
+        ({"reference": "Patient/23", "type": "Patient"}, True),
+        ({"reference": "Patient/23", "type": "Device"}, False),
+        ({"reference": "http://fhir.example.org/Patient/23", "type": "Patient"}, True),
+        ({"reference": "http://fhir.example.org/Patient/23", "type": "Device"}, False),
+        ({"reference": "http://fhir.example.org/Patient/23"}, True),
+        ({"reference": "https://example.org/foobar"}, True),
+        ({"reference": "ftp://ftp-server.com/foobar/example-0.1"}, True),
+        ({"reference": "Patient"}, False),
+        ({"reference": "foobar/23"}, False),
+        ({"reference": "#foobar"}, True),  # Internal fragment reference
+        ({"reference": "#foobar/23"}, True),  # Internal fragment reference
+    ],
+)
+def test_reference_validator(values: typing.Dict, is_valid: bool) -> None:
+    """Test reference custom validator."""
+    if is_valid:
+        r4._reference_validator(values)
+    else:
+        with pytest.raises(ValueError):
+            r4._reference_validator(values)
+
+
+@pytest.mark.parametrize(
+    ("reference", "expected"),
+    [
+        ("Patient/23", (None, "Patient", "23", None)),
+        ("Patient/23/_history/2", (None, "Patient", "23", "2")),
+        (
+            "http://fhir.example.org/fhir/Patient/23",
+            ("fhir.example.org/fhir/", "Patient", "23", None),
+        ),
+        (
+            "https://example.org/Group/23/_history/a.1",
+            ("example.org/", "Group", "23", "a.1"),
+        ),
+        (
+            "http://example.org/Patient/Group/1",
+            ("example.org/Patient/", "Group", "1", None),
+        ),
+        ("http://example.org/Patient/Foo/1", None),
+        ("Foo/23", None),
+        ("MetadataResource/23", None),
+        ("Patient/23/_history", None),
+        ("Patient/", None),
+        ("#foobar", None),
+        (None, None),
+    ],
+)
+def test_parse_literal_reference(
+    reference: typing.Optional[str], expected: typing.Optional[typing.Tuple]
+) -> None:
+    parsed = r4.parse_literal_reference(reference)
+    if expected is None:
+        assert parsed is None
+    else:
+        assert parsed == r4.ParsedLiteralReference(*expected)
+        assert parsed.resource_type == expected[1]
+        # Parsed references are cached.
+        assert r4.parse_literal_reference(reference) is parsed
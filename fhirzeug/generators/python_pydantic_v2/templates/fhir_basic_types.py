@@ -0,0 +1,84 @@
+import re  # noqa: F811
+import typing  # noqa: F811
+import pydantic  # noqa: F811
+from typing_extensions import Annotated
+
+
+def exact_regex(regex):
+    """Anchor a regex, for the `regex` crate used by pydantic to validate strings."""
+    return r"^(?:" + regex + r")$"
+
+
+def exact_regex_constr(regex: str):
+    return Annotated[str, pydantic.StringConstraints(pattern=exact_regex(regex))]
+
+
+FHIRString = Annotated[str, pydantic.StringConstraints(strip_whitespace=True)]
+FHIRRequiredString = Annotated[
+    str, pydantic.StringConstraints(min_length=1, strip_whitespace=True)
+]
+
+# Date and time patterns of the FHIR specification, rewritten with non-capturing
+# groups. Look-behinds are not supported by the `regex` crate, so the year `0000`
+# is excluded by alternation as in the specification.
+_YEAR = r"(?:[1-9][0-9]{3}|0[1-9][0-9]{2}|00[1-9][0-9]|000[1-9])"
+_MONTH = r"(?:0[1-9]|1[0-2])"
+_DAY = r"(?:0[1-9]|[1-2][0-9]|3[0-1])"
+_TIME = r"(?:[01][0-9]|2[0-3]):[0-5][0-9]:(?:[0-5][0-9]|60)(?:\.[0-9]+)?"
+_TIMEZONE = r"(?:Z|[+-](?:(?:0[0-9]|1[0-3]):[0-5][0-9]|14:00))"
+
+FHIRDateTime = exact_regex_constr(
+    regex=rf"{_YEAR}(?:-{_MONTH}(?:-{_DAY}(?:T{_TIME}{_TIMEZONE})?)?)?"
+)
+FHIRDate = exact_regex_constr(regex=rf"{_YEAR}(?:-{_MONTH}(?:-{_DAY})?)?")
+FHIRInstant = exact_regex_constr(regex=rf"{_YEAR}-{_MONTH}-{_DAY}T{_TIME}{_TIMEZONE}")
+FHIRTime = exact_regex_constr(regex=_TIME)
+FHIRCode = exact_regex_constr(regex=r"[^\s]+(\s[^\s]+)*")
+
+FHIROid = exact_regex_constr(regex=r"urn:oid:[0-2](\.(0|[1-9][0-9]*))+")
+
+FHIRId = exact_regex_constr(regex=r"[A-Za-z0-9\-\.]{1,64}")
+
+FHIRBase64Binary = exact_regex_constr(regex=r"(\s*([0-9a-zA-Z\+/=]){4}\s*)+")
+
+
+def validate_factory(name: str, pattern: str):
+    regex = re.compile(r"\A(?:" + pattern + r")\Z")
+
+    def validate_int_string(v):
+        """Validate a string given a FHIR regex."""
+        if isinstance(v, str):
+            if regex.match(v) is None:
+                msg = f"String does not match {name} pattern : {pattern}"
+                raise ValueError(msg)
+            return int(v)
+        return v
+
+    return pydantic.BeforeValidator(validate_int_string)
+
+
+# Integer field following FHIR specs.
+# https://www.hl7.org/fhir/datatypes.html#integer
+FHIRInt = Annotated[
+    int, pydantic.Strict(), validate_factory("FHIRInt", "[0]|[-+]?[1-9][0-9]*")
+]
+
+# Unsigned integer field following FHIR specs.
+# https://www.hl7.org/fhir/datatypes.html#unsignedInt
+FHIRUnsignedInt = Annotated[
+    int,
+    pydantic.Strict(),
+    pydantic.Field(ge=0),
+    validate_factory("FHIRUnsignedInt", "[0]|([1-9][0-9]*)"),
+]
+
+# Positive integer field following FHIR specs.
+# Warning : FHIR Spec regex : "+?[1-9][0-9]*" seems invalid
+#           I think that intended use is "[+]?[1-9][0-9]*"
+# https://www.hl7.org/fhir/datatypes.html#positiveInt
+FHIRPositiveInt = Annotated[
+    int,
+    pydantic.Strict(),
+    pydantic.Field(gt=0),
+    validate_factory("FHIRPositiveInt", "[+]?[1-9][0-9]*"),
+]
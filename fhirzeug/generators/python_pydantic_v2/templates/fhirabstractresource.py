@@ -0,0 +1,7 @@
+
+
+class FHIRAbstractResource(FHIRAbstractBase):
+
+    resource_type: typing.Literal["FHIRAbstractResource"] = pydantic.Field(
+        "FHIRAbstractResource", alias="resourceType"
+    )
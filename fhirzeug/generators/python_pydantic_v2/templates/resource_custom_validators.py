@@ -0,0 +1,131 @@
+# Define custom root validators.
+# Validators are added to the already defined Resources in resource_footer.py .
+
+import functools  # noqa: F811
+import re  # noqa: F811
+import typing
+import pydantic
+
+
+def _build_fhir_resource_names() -> typing.FrozenSet[str]:
+    """Return the names of the concrete resources, from RESOURCE_TYPE_MAP."""
+    _resources_to_ignore = {"MetadataResource", "Parameters"}
+    return frozenset(
+        _resource_name
+        for _resource_name, _resource in RESOURCE_TYPE_MAP.items()
+        if len(_resource.__subclasses__()) == 0
+        and _resource_name not in _resources_to_ignore
+    )
+
+
+_FHIR_RESOURCE_NAMES = _build_fhir_resource_names()
+
+_FHIR_API_REGEX = re.compile(
+    # Taken from https://www.hl7.org/fhir/references.html#literal
+    r"\A"
+    # From https://www.hl7.org/fhir/http.html#root : "The protocols http: and https:
+    # SHALL NOT be used to refer to different underlying objects" -> we do not take it
+    # in base_url group.
+    r"(?:(?:http|https):\/\/(?P<base_url>(?:[A-Za-z0-9\-\\\.\:\%\$]*\/)+))?"
+    # Resource type is checked against _FHIR_RESOURCE_NAMES once matched.
+    r"(?P<resource_type>[A-Za-z]+)\/"
+    r"(?P<resource_id>[A-Za-z0-9\-\.]{1,64})"
+    r"(?:\/_history\/(?P<version>[A-Za-z0-9\-\.]{1,64}))?"
+    r"\Z"
+)
+
+# References are often repeated, e.g. across the entries of a Bundle.
+_REFERENCE_CACHE_SIZE = 4096
+
+
+class ParsedLiteralReference(typing.NamedTuple):
+    """An object containing data parsed from a literal reference with known pattern."""
+
+    base_url: typing.Optional[str]
+    resource_type: str
+    resource_id: str
+    version: typing.Optional[str]
+
+
+@functools.lru_cache(maxsize=_REFERENCE_CACHE_SIZE)
+def parse_literal_reference(
+    reference: typing.Optional[str],
+) -> typing.Optional[ParsedLiteralReference]:
+    """Try to parse a reference as if the resource is server by a FHIR API server.
+
+    Warnings :
+        - not all literal references points to a FHIR Server.
+        - if reference matches the patterns, it doesn't guarantee it points to a FHIR
+          Server.
+    """
+    if reference is not None:
+        match = _FHIR_API_REGEX.match(reference)
+        if match is not None and match.group("resource_type") in _FHIR_RESOURCE_NAMES:
+            # An empty base_url is converted to None.
+            return ParsedLiteralReference(
+                match.group("base_url") or None,
+                match.group("resource_type"),
+                match.group("resource_id"),
+                match.group("version"),
+            )
+    return None
+
+
+_ABSOLUTE_URL_ADAPTER = pydantic.TypeAdapter(pydantic.AnyUrl)
+
+
+@functools.lru_cache(maxsize=_REFERENCE_CACHE_SIZE)
+def _is_absolute_url(reference: str) -> bool:
+    """Test if a string is an absolute URL."""
+    try:
+        _ABSOLUTE_URL_ADAPTER.validate_python(reference)
+    except pydantic.ValidationError:
+        return False
+    return True
+
+
+def _reference_validator(values):
+    """Validate Reference resource values."""
+    resource_type = values.get("type")
+    reference = values.get("reference")
+    if reference is not None:
+        parsed_literal_reference = parse_literal_reference(reference)
+        if parsed_literal_reference is not None:
+            if (
+                resource_type is not None
+                and parsed_literal_reference.resource_type != resource_type
+            ):
+                raise ValueError(
+                    "Reference type and resource_type from reference URL must match."
+                )
+        elif reference.startswith("#"):
+            # Reference is an internal fragment reference referring to contained resources.
+            pass
+        elif not _is_absolute_url(reference):
+            # Reference is neither an absolute URL nor an URL relative to a FHIR
+            # RESTful server with pattern "TYPE/ID".
+            raise ValueError(
+                "Reference must be an absolute URL or an URL relative to a FHIR RESTful server"
+            )
+    return values
+
+
+def _extension_element_validator(values):
+    """Validate extension element values.
+
+    From https://www.hl7.org/fhir/extensibility.html#Extension :
+    "An extension SHALL have either a value (i.e. a value[x] element)
+    or sub-extensions, but not both. If present, the value[x] element
+    SHALL have content (value attribute or other elements)."
+    """
+    err_msg = "An extension SHALL have either a value or sub-extensions, but not both."
+    if values.get("extension") is not None:
+        for key, value in values.items():
+            if key.startswith("value_"):
+                assert value is None, err_msg
+    return values
+
+
+# Dynamically add validators to Resources.
+Reference._add_post_root_validator(_reference_validator)
+Extension._add_post_root_validator(_extension_element_validator)
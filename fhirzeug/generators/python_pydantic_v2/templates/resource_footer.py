@@ -0,0 +1,69 @@
+class PrimitiveExtension(Element):
+    """Class to describe any extension of a primitive value.
+
+    Contains only `id` and `extension`.
+    """
+
+
+def _validation_error(
+    model: typing.Type[pydantic.BaseModel], e: Exception, loc: str, input_: typing.Any
+) -> pydantic_core.ValidationError:
+    """Convert an exception to a pydantic ValidationError located at `loc`."""
+    return pydantic_core.ValidationError.from_exception_data(
+        model.__name__,
+        [
+            {
+                "type": "value_error",
+                "loc": (loc,),
+                "input": input_,
+                "ctx": {"error": str(e)},
+            }
+        ],
+    )
+
+
+def _get_resource_class(dict_: typing.Any) -> typing.Type[FHIRAbstractResource]:
+    """Return the class of a resource given as a dict from its resourceType."""
+    if not isinstance(dict_, Mapping) or "resourceType" not in dict_:
+        raise ValueError("Key 'resourceType' must be provided.")
+
+    resource_type = dict_["resourceType"]
+    if resource_type not in RESOURCE_TYPE_MAP:
+        raise ValueError(f"ResourceType '{resource_type}' is not a valid Resource.")
+
+    return RESOURCE_TYPE_MAP[resource_type]
+
+
+def _resource_factory(value: typing.Any) -> typing.Any:
+    """Validate a nested resource with the class of its resourceType."""
+    if value is None or isinstance(value, Resource):
+        return value
+    return _get_resource_class(value).model_validate(value)
+
+
+def from_dict(dict_: dict):
+    """Factory to load resources directly.
+
+    The resources will be instanciated based on their resourceType property."""
+
+    try:
+        resource_class = _get_resource_class(dict_)
+    except ValueError as e:
+        # Raise a ValidationError if resourceType is not valid.
+        raise _validation_error(FHIRAbstractResource, e, "resourceType", dict_)
+    return resource_class.model_validate(dict_)
+
+
+def from_raw(*args, **kwargs):
+    """Factory to load resources directly from the raw json string.
+
+    The resources will be instanciated based on their resourceType property."""
+
+    try:
+        # Raise a ValueError if duplicated keys in raw JSON.
+        dict_ = json_loads(*args, **kwargs)
+    except ValueError as e:
+        # ValueError is converted to a pydantic ValidationError.
+        raise _validation_error(FHIRAbstractResource, e, "JSON decoding", args)
+
+    return from_dict(dict_)
@@ -0,0 +1,542 @@
+import enum
+import decimal
+import re
+import secrets
+import typing
+from collections.abc import Mapping
+import json
+
+
+import pydantic
+import pydantic_core
+
+# Field of JSON-primitive types can be extended in FHIR using an underscore
+# Example: field `given` (type `str`) is extended by `_given`.
+# However, in pydantic fields beginning with an underscore are private attributes.
+# As a workaround, the extension field name removes the underscore prefix and adds
+# a `__extension` suffix, and the JSON name is set as alias.
+# Generated classes declare all their aliases statically.
+_EXTENSION_SUFFIX = "__extension"
+
+# A choice group is described by the names of its fields and whether it is optional.
+ChoiceGroup = typing.Tuple[typing.FrozenSet[str], bool]
+
+
+def _validate_choice_groups(
+    choice_groups: typing.Tuple[ChoiceGroup, ...], values: typing.Dict[str, typing.Any]
+) -> None:
+    """Check that at most one field, or exactly one if required, of each group is set.
+
+    See https://www.hl7.org/fhir/formats.html#choice .
+    """
+    for choices, optional in choice_groups:
+        setted_values = sum(1 for choice in choices if values.get(choice) is not None)
+        if setted_values > 1:
+            raise ValueError(f"Only one of the fields is allowed to be set ({choices})")
+        elif not optional and setted_values < 1:
+            raise ValueError(f"At least one of the fields needs to be set ({choices})")
+
+
+def _build_primitive_extension_keys(
+    primitive_fields: typing.Dict[str, typing.Tuple[str, str]]
+) -> typing.Dict[str, typing.Tuple[str, str]]:
+    """Map the names of primitive extensions to their field name and alias.
+
+    `primitive_fields` is a static table generated for each class. It maps every
+    JSON-primitive field name to its alias and to the alias of its extension.
+    Example: `{"birth_date": ("birthDate", "_birthDate")}`.
+
+    Extension can either be present as the real extension name or its alias.
+    Both are mapped to the real field name and its alias.
+    """
+    extension_keys: typing.Dict[str, typing.Tuple[str, str]] = {}
+    for field_name, (field_alias, extension_alias) in primitive_fields.items():
+        extension_keys[field_name + _EXTENSION_SUFFIX] = (field_name, field_alias)
+        extension_keys[extension_alias] = (field_name, field_alias)
+    return extension_keys
+
+
+def _validate_primitive_fields(
+    extension_keys: typing.Dict[str, typing.Tuple[str, str]],
+    values: typing.Dict[str, typing.Any],
+) -> typing.Dict[str, typing.Any]:
+    """Validate the consistency of all extended primitive fields present in `values`.
+
+    Only the extensions actually present in the input are looked at, so the cost
+    of the validation depends on the provided fields, not on the declared ones.
+    """
+    present_extensions = [key for key in values if key in extension_keys]
+    for extension_name in present_extensions:
+        # Field can either be present as the real field name or its alias
+        inner_field_name, field_alias = extension_keys[extension_name]
+        if inner_field_name not in values:
+            inner_field_name = field_alias
+            if inner_field_name not in values:
+                continue
+
+        # Validate field and extension values and get validated values
+        validated_field_value, validated_extension_value = _validate_primitive_field(
+            values[inner_field_name], values[extension_name]
+        )
+
+        # Assign new values
+        values[inner_field_name] = validated_field_value
+        values[extension_name] = validated_extension_value
+    return values
+
+
+def _validate_primitive_field(
+    initial_field_value: typing.Any, extension_field_value: typing.Any
+) -> typing.Tuple[typing.Any, typing.Any]:
+    """Validate the consistency of a primitive field or list-of-primitives field.
+
+    Note: `initial_field_value` refer to the primitive field that is extended
+          and `extension_field_value` refer to the extension field.
+
+    Validators :
+        - from https://www.hl7.org/fhir/json.html#primitive :
+          "In the case where the primitive element may repeat, it is represented
+          in two arrays. JSON null values are used to fill out both arrays so
+          that the id and/or extension are aligned with the matching value in the
+          first array."
+          "Note: when one of the repeating elements has no value, it is represented
+          in the first array using a null. When an element has a value but no
+          extension/id, the second array will have a null at the position of that
+          element."
+
+        - TODO : if a field is required, it is possible to provide only an extension
+                 instead. At the moment, this behavior is NOT implemented (a required
+                 primitive field must always be filled). TODO : fix this.
+
+    See tests in `tests/pydantic/test_primitive_list.py` for examples.
+    """
+    if isinstance(extension_field_value, list):
+        if initial_field_value is None:
+            if None in extension_field_value:
+                # Should never reach this point.
+                raise Exception(
+                    "None values must have already been removed by `_without_empty_items`."
+                )
+        else:
+            # Extension is a list -> initial field must also be a list (or None)
+            if not isinstance(initial_field_value, list):
+                raise ValueError(
+                    f"If an extension of a primitive field is a list, the initial field must be either `null` or a list. Not {type(initial_field_value)}."
+                )
+
+            # Validate that both lists have same length
+            if len(initial_field_value) != len(extension_field_value):
+                if all(value is None for value in initial_field_value) and any(
+                    value is not None for value in extension_field_value
+                ):
+                    # Case `initial_field_value=[None]` and `extension_field_value=['A', None, 'B']`
+                    # Initial value is set to `None` and `None` values in second array are removed.
+                    return (
+                        None,
+                        [value for value in extension_field_value if value is not None],
+                    )
+                elif any(value is not None for value in initial_field_value) and all(
+                    value is None for value in extension_field_value
+                ):
+                    # Case `initial_field_value=['A', None, 'B']` and `extension_field_value=[None]`
+                    # Extension value is set to `None` and `None` values in first array are removed.
+                    return (
+                        [value for value in initial_field_value if value is not None],
+                        None,
+                    )
+                else:
+                    raise ValueError(
+                        "When setting a primitive extension of a list, field list and field extension list must be both of same length."
+                    )
+
+            if len(initial_field_value) == 0:
+                raise ValueError(
+                    "When setting a primitive extension of a list, field and field extension cannot be both set with an empty list."
+                )
+
+            for initial_item, extension_item in zip(
+                initial_field_value, extension_field_value
+            ):
+                if initial_item is None and extension_item is None:
+                    raise ValueError(
+                        "When setting a primitive extension of a list, field item and primitive item cannot be `null` at the same position."
+                    )
+
+    if isinstance(initial_field_value, list):
+        if extension_field_value is None:
+            # Should never reach this point.
+            # List is not extended. Therefore, `null` values must not be present.
+            # `null` values should have already been removed by `_without_empty_items` since
+            # there wasn't an extension list.
+            if None in initial_field_value:
+                raise Exception(
+                    "None values must have already been removed by `_without_empty_items`."
+                )
+        elif isinstance(extension_field_value, list):
+            # Case already handled above
+            pass
+        else:
+            # Should have already been validated.
+            raise ValueError(
+                "Extension of a field with a list of primitive type must be of type `list`."
+            )
+
+    return initial_field_value, extension_field_value
+
+
+class DocEnum(enum.Enum):
+    """Enum with docstrings support."""
+
+    def __new__(cls, value, doc=None):
+        """Add docstring to the member of Enum if exists.
+
+        Args:
+            value: Enum member value
+            doc: Enum member docstring, None if not exists
+        """
+        obj = str.__new__(cls, value)
+        obj._value_ = value
+        if doc:
+            obj.__doc__ = doc
+        return obj
+
+    @classmethod
+    def __get_pydantic_json_schema__(cls, core_schema, handler):
+        """Describe each member of the Enum in the JSON schema."""
+        json_schema = handler(core_schema)
+        handler.resolve_ref_schema(json_schema)["enum"] = [
+            {"value": item.value, "description": item.__doc__} for item in cls
+        ]
+        return json_schema
+
+
+class DecimalEncoder(json.JSONEncoder):
+    """JSON encoder writing `decimal.Decimal` values losslessly.
+
+    The encoding itself is done by the standard library (its C implementation when
+    available). Each decimal is first replaced by a placeholder string, unique to the
+    encoding call, which is then substituted by the exact decimal representation.
+    """
+
+    def iterencode(self, o, _one_shot=False):
+        decimals: typing.List[str] = []
+        placeholder = f"__decimal_{secrets.token_hex(8)}_"
+        pattern = re.compile(f'"{placeholder}([0-9]+)"')
+        default = self.default
+
+        def _default(obj):
+            if isinstance(obj, decimal.Decimal):
+                decimals.append(str(obj))
+                return placeholder + str(len(decimals) - 1)
+            if isinstance(obj, Mapping):
+                return dict(obj)
+            if isinstance(obj, typing.Iterable) and (not isinstance(obj, str)):
+                return list(obj)
+            return default(obj)
+
+        def _substitute(match: typing.Match) -> str:
+            return decimals[int(match.group(1))]
+
+        self.default = _default
+        try:
+            chunks = super().iterencode(o, _one_shot=_one_shot)
+        finally:
+            # The encoder reads `self.default` when built, it can be restored now.
+            self.default = default
+
+        for chunk in chunks:
+            if decimals:
+                chunk = pattern.sub(_substitute, chunk)
+            yield chunk
+
+
+def check_for_duplicate_keys(
+    ordered_pairs: typing.List[typing.Tuple[typing.Hashable, typing.Any]]
+) -> typing.Dict:
+    """Check for duplicated keys.
+
+    Raise ValueError if a duplicate key exists in provided ordered
+    list of pairs, otherwise return a dict.
+
+    The dict is built natively and its length compared to the number of pairs. The
+    pairs are only iterated in Python to report the duplicated key.
+    """
+    dict_out = dict(ordered_pairs)
+    if len(dict_out) != len(ordered_pairs):
+        seen: typing.Set[typing.Hashable] = set()
+        for key, _ in ordered_pairs:
+            if key in seen:
+                raise ValueError(f"Duplicate key: {key}")
+            seen.add(key)
+    return dict_out
+
+
+def json_dumps(*args, **kwargs):
+    return json.dumps(*args, **kwargs, cls=DecimalEncoder)
+
+
+def json_dump(obj: typing.Any, fp: typing.TextIO, **kwargs) -> None:
+    """Serialize `obj` as JSON into a writable text buffer.
+
+    Output is the same as `json_dumps`. Chunks are written to `fp` as they are
+    produced by the encoder instead of being joined first.
+    """
+    for chunk in DecimalEncoder(**kwargs).iterencode(obj, _one_shot=True):
+        fp.write(chunk)
+
+
+def json_dumpb(obj: typing.Any, default: typing.Optional[typing.Callable] = None) -> bytes:
+    """Serialize `obj` as compact UTF-8 encoded JSON.
+
+    If `orjson` (>= 3.9) is installed, it is used as a faster backend. Otherwise,
+    the standard library encoder is used. Both backends produce the same output.
+    """
+    if _orjson_dumps is not None:
+        return _orjson_dumps(obj, default=default)
+    return json.dumps(
+        obj,
+        cls=DecimalEncoder,
+        default=default,
+        separators=(",", ":"),
+        ensure_ascii=False,
+    ).encode("utf-8")
+
+
+def _build_orjson_dumps() -> typing.Optional[typing.Callable[..., bytes]]:
+    """Return a serializer based on `orjson` if a compatible version is installed."""
+    try:
+        import orjson  # type: ignore
+    except ImportError:
+        return None
+    if not hasattr(orjson, "Fragment"):
+        # `orjson.Fragment` is required to write decimals losslessly.
+        return None
+
+    def _orjson_dumps(
+        obj: typing.Any, default: typing.Optional[typing.Callable] = None
+    ) -> bytes:
+        def _default(value):
+            if isinstance(value, decimal.Decimal):
+                return orjson.Fragment(str(value))
+            if isinstance(value, Mapping):
+                return dict(value)
+            if isinstance(value, typing.Iterable) and (not isinstance(value, str)):
+                return list(value)
+            if default is not None:
+                return default(value)
+            raise TypeError(
+                f"Object of type {value.__class__.__name__} is not JSON serializable"
+            )
+
+        return orjson.dumps(obj, default=_default, option=orjson.OPT_NON_STR_KEYS)
+
+    return _orjson_dumps
+
+
+_orjson_dumps = _build_orjson_dumps()
+
+
+_json_decoder = json.JSONDecoder(
+    parse_float=decimal.Decimal, object_pairs_hook=check_for_duplicate_keys
+)
+
+
+def json_loads(s: typing.Union[str, bytes, bytearray], **kwargs):
+    """Deserialize a JSON document, keeping decimals exact.
+
+    Raise ValueError if an object of the document contains a duplicated key.
+    """
+    if kwargs:
+        return json.loads(
+            s,
+            **kwargs,
+            parse_float=decimal.Decimal,
+            object_pairs_hook=check_for_duplicate_keys,
+        )
+    if isinstance(s, (bytes, bytearray)):
+        s = s.decode(json.detect_encoding(s), "surrogatepass")
+    # Reuse a single decoder instead of building one per call as `json.loads` does.
+    return _json_decoder.decode(s)
+
+
+class FHIRAbstractBase(pydantic.BaseModel):
+    """Abstract base class for all FHIR elements."""
+
+    # Not named `Meta`: pydantic v2 resolves annotations in the class namespace first,
+    # which would shadow the FHIR `Meta` element.
+    class FHIRMeta:
+        profile: typing.List[str] = []
+        """ Profiles this resource claims to conform to.
+        List of `str` items. """
+
+    model_config = pydantic.ConfigDict(
+        populate_by_name=True,
+        extra="forbid",
+        # Schemas are built on first use, not for every class at import.
+        defer_build=True,
+    )
+
+    # Static tables completed by each generated class with its own fields.
+    _fhir_primitive_extensions: typing.ClassVar[
+        typing.Dict[str, typing.Tuple[str, str]]
+    ] = {}
+    _fhir_choice_groups: typing.ClassVar[typing.Tuple[ChoiceGroup, ...]] = ()
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: typing.Any) -> None:
+        super().__pydantic_init_subclass__(**kwargs)
+        # Generated classes declare the tables of their own fields only.
+        primitive_fields = cls.__dict__.get("_fhir_primitive_fields", {})
+        if primitive_fields:
+            cls._fhir_primitive_extensions = {
+                **cls._fhir_primitive_extensions,
+                **_build_primitive_extension_keys(primitive_fields),
+            }
+        choice_fields = cls.__dict__.get("_fhir_choice_fields", ())
+        if choice_fields:
+            cls._fhir_choice_groups = cls._fhir_choice_groups + choice_fields
+
+    def model_dump(self, **kwargs: typing.Any) -> typing.Dict[str, typing.Any]:
+        serialized = super().model_dump(**kwargs)
+        return _without_empty_items(serialized) or {}
+
+    def model_dump_json(
+        self, *, indent: typing.Optional[int] = None, **kwargs: typing.Any
+    ) -> str:
+        """Serialize to JSON, with decimals written as exact JSON numbers."""
+        return json_dumps(self.model_dump(**kwargs), indent=indent)
+
+    @pydantic.model_validator(mode="before")
+    @classmethod
+    def _validate_input(cls, values: typing.Any) -> typing.Any:
+        """Strip empty elements, then validate primitive extensions.
+
+        A single validator is used, so that primitive extensions are validated
+        after empty elements have been stripped.
+        """
+        if not isinstance(values, Mapping):
+            return values
+        # This strips all empty elements according to the fhir spec.
+        values = _without_empty_items(values) or {}
+        if cls._fhir_primitive_extensions:
+            values = _validate_primitive_fields(cls._fhir_primitive_extensions, values)
+        return values
+
+    @pydantic.model_validator(mode="after")
+    def _validate_model(self) -> "FHIRAbstractBase":
+        """Validate choice groups and run dynamic validators.
+
+        The dynamic validators can be changed after definition of the BaseModel
+        by using method `_add_post_root_validator`.
+        """
+        values = self.__dict__
+        if self._fhir_choice_groups:
+            _validate_choice_groups(self._fhir_choice_groups, values)
+        for validator in self._dynamic_validators():
+            validator(values)
+        return self
+
+    @classmethod
+    def _add_post_root_validator(
+        cls, validator: typing.Callable[[typing.Dict], typing.Dict]
+    ) -> None:
+        """Add a post root validator to the FHIR object.
+
+        The validator receives the validated values as a dict. All dynamic
+        validators must be considered to be independent from each other.
+        """
+        dynamic_validators_field = cls._get_dynamic_validators_field_name()
+        dynamic_validators = cls.__dict__.get(dynamic_validators_field, [])
+        dynamic_validators.append(validator)
+        setattr(cls, dynamic_validators_field, dynamic_validators)
+
+    @classmethod
+    def _dynamic_validators(
+        cls,
+    ) -> typing.Generator[typing.Callable[[typing.Dict], typing.Dict], None, None]:
+        """Return a generator iterating over dynamic validators."""
+        for subclass in cls.__mro__:
+            if issubclass(subclass, FHIRAbstractBase):
+                subclass_field = subclass._get_dynamic_validators_field_name()
+                subclass_validators = subclass.__dict__.get(subclass_field)
+                if subclass_validators is not None:
+                    yield from subclass_validators
+            else:
+                # If here, it means we are already in the parents' classes of FHIRAbstractBase
+                # We do not need to continue to iterate
+                return
+
+    @classmethod
+    def _get_dynamic_validators_field_name(cls) -> str:
+        """Return a field "unique" to this class to store dynamic validators."""
+        return f"__dynamic_validators__{cls.__name__}"
+
+
+def _without_empty_items(obj: typing.Any):
+    """Clean empty items.
+
+    See : https://www.hl7.org/fhir/datatypes.html#representations
+
+    Extension of list of primitive values is handled differently by
+    its own root validator. See: https://www.hl7.org/fhir/json.html#null
+    """
+    if isinstance(obj, Mapping):
+        cleaned_dict = {}
+        for key, value in obj.items():
+            primitive_key, extension_key = None, None
+            if key.startswith("_") and key[1:] in obj:
+                primitive_key = key[1:]
+                extension_key = key
+            elif ("_" + key) in obj:
+                primitive_key = key
+                extension_key = "_" + key
+            elif (
+                key.endswith(_EXTENSION_SUFFIX)
+                and key[: -len(_EXTENSION_SUFFIX)] in obj
+            ):
+                primitive_key = key[: -len(_EXTENSION_SUFFIX)]
+                extension_key = key
+            elif key + _EXTENSION_SUFFIX in obj:
+                primitive_key = key
+                extension_key = key + _EXTENSION_SUFFIX
+
+            if (primitive_key, extension_key) != (None, None):
+                primitive_value = obj[primitive_key]
+                extension_value = obj[extension_key]
+                if isinstance(primitive_value, list) and isinstance(
+                    extension_value, list
+                ):
+                    if primitive_key not in cleaned_dict:
+                        assert extension_key not in cleaned_dict
+                        # WARNING : Here lists consistency is NOT validated
+                        #           This is done later by the primitive field validator
+                        cleaned_dict[primitive_key] = [
+                            _without_empty_items(value) for value in primitive_value
+                        ]
+                        cleaned_dict[extension_key] = [
+                            _without_empty_items(value) for value in extension_value
+                        ]
+                    continue
+
+            cleaned_value = _without_empty_items(value)
+            if cleaned_value is not None:
+                cleaned_dict[key] = cleaned_value
+
+        if cleaned_dict:
+            return cleaned_dict
+        return None
+
+    if isinstance(obj, str):
+        obj = obj.strip()
+        if not obj:
+            return None
+        return obj
+
+    if isinstance(obj, (list, tuple)):
+        cleaned_list_with_none = [_without_empty_items(item) for item in obj]
+        cleaned_list = [item for item in cleaned_list_with_none if item is not None]
+        if cleaned_list:
+            return cleaned_list
+        return None
+
+    return obj
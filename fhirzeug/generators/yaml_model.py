@@ -1,5 +1,5 @@
 from pathlib import Path
-from typing import List, Dict
+from typing import List, Dict, Optional
 
 from pydantic import BaseModel
 
@@ -20,12 +20,14 @@ class Template(BaseModel):
     Attributes:
         codesystems_source: Source template to generate enums
         generate_code: Whether code generation must be executed
+        registry_source: Source template to generate the registry of resources
         resource_source: Source template to generate resources
         source: In which directory to find templates
     """
 
-    codesystems_source: str
+    codesystems_source: Optional[str] = None
     generate_code: bool
+    registry_source: Optional[str] = None
     resource_source: str
     source: str
 
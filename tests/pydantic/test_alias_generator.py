@@ -1,5 +1,8 @@
+import typing
+
 import pydantic
 from fhirzeug.generators.python_pydantic.templates.resource_header import (
+    FHIRAbstractBase,
     camelcase_alias_generator,
 )
 
@@ -33,3 +36,35 @@ def test_aliases():
     assert x.foo_bar == "bar"
 
     assert x.dict(by_alias=True) == values
+
+
+class StaticAliasModel(FHIRAbstractBase):
+    """Model declaring its aliases statically, as generated classes do."""
+
+    birth_date: typing.Optional[str]
+    birth_date__extension: typing.Optional[str]
+
+    class Config:
+        alias_generator = None
+        fields = {"birth_date": "birthDate", "birth_date__extension": "_birthDate"}
+
+
+class StaticAliasChildModel(StaticAliasModel):
+    """Child model inheriting the aliases of its parent."""
+
+    class_: typing.Optional[str]
+
+    class Config:
+        fields = {"class_": "class"}
+
+
+def test_static_aliases():
+    assert StaticAliasModel.__fields__["birth_date"].alias == "birthDate"
+    assert StaticAliasModel.__fields__["birth_date__extension"].alias == "_birthDate"
+    assert StaticAliasChildModel.__fields__["birth_date"].alias == "birthDate"
+    assert StaticAliasChildModel.__fields__["class_"].alias == "class"
+
+    values = {"birthDate": "2020", "_birthDate": "ext", "class": "foo"}
+    x = StaticAliasChildModel(**values)
+    assert x.birth_date == "2020"
+    assert x.dict(by_alias=True) == values
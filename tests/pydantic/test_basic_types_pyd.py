@@ -1,5 +1,6 @@
 import base64
 import decimal
+import re
 import typing
 
 
@@ -132,6 +133,63 @@ def test_fhirinstant():
     model = ExampleModel(instant="2015-02-07T13:28:17.239+02:00")  # noqa : F841
 
 
+# Patterns of the FHIR specification, used as reference for the rewritten ones.
+SPEC_DATE_TIME_REGEXES = {
+    FHIRDateTime: r"([0-9]([0-9]([0-9][1-9]|[1-9]0)|[1-9]00)|[1-9]000)(-(0[1-9]|1[0-2])(-(0[1-9]|[1-2][0-9]|3[0-1])(T([01][0-9]|2[0-3]):[0-5][0-9]:([0-5][0-9]|60)(\.[0-9]+)?(Z|(\+|-)((0[0-9]|1[0-3]):[0-5][0-9]|14:00)))?)?)?",
+    FHIRDate: r"([0-9]([0-9]([0-9][1-9]|[1-9]0)|[1-9]00)|[1-9]000)(-(0[1-9]|1[0-2])(-(0[1-9]|[1-2][0-9]|3[0-1]))?)?",
+    FHIRInstant: r"([0-9]([0-9]([0-9][1-9]|[1-9]0)|[1-9]00)|[1-9]000)-(0[1-9]|1[0-2])-(0[1-9]|[1-2][0-9]|3[0-1])T([01][0-9]|2[0-3]):[0-5][0-9]:([0-5][0-9]|60)(\.[0-9]+)?(Z|(\+|-)((0[0-9]|1[0-3]):[0-5][0-9]|14:00))",
+    FHIRTime: r"([01][0-9]|2[0-3]):[0-5][0-9]:([0-5][0-9]|60)(\.[0-9]+)?",
+}
+
+DATE_TIME_SAMPLES = [
+    "2013",
+    "2013-04",
+    "2013-04-02",
+    "2013-04-02T09:30:10Z",
+    "2013-04-02T09:30:10.123+01:00",
+    "2013-04-02T23:59:60-14:00",
+    "09:30:10",
+    "09:30:10.5",
+]
+
+
+def _date_time_candidates() -> typing.Iterator[str]:
+    """Generate valid and almost valid date and time strings."""
+    for year in range(10000):
+        yield f"{year:04}"
+        yield f"{year:04}-01-01T00:00:00Z"
+    for number in range(100):
+        yield f"2013-{number:02}"
+        yield f"2013-04-{number:02}"
+        yield f"2013-04-02T{number:02}:30:10Z"
+        yield f"2013-04-02T09:{number:02}:10Z"
+        yield f"2013-04-02T09:30:{number:02}Z"
+        yield f"{number:02}:30:10"
+        yield f"09:{number:02}:10"
+        yield f"09:30:{number:02}.0"
+        for minutes in range(100):
+            for sign in "+-":
+                yield f"2013-04-02T09:30:10{sign}{number:02}:{minutes:02}"
+
+    alphabet = "0123456789-+:.TZ a\n"
+    for sample in DATE_TIME_SAMPLES:
+        for index in range(len(sample) + 1):
+            yield sample[:index]
+            yield sample[:index] + sample[index + 1 :]
+            for character in alphabet:
+                yield sample[:index] + character + sample[index + 1 :]
+                yield sample[:index] + character + sample[index:]
+
+
+@pytest.mark.parametrize("type_", list(SPEC_DATE_TIME_REGEXES))
+def test_date_time_regexes(type_: typing.Any):
+    """Date and time patterns accept exactly the same values as the FHIR ones."""
+    spec_regex = re.compile(r"\A" + SPEC_DATE_TIME_REGEXES[type_] + r"\Z")
+    for candidate in _date_time_candidates():
+        expected = spec_regex.match(candidate) is not None
+        assert (type_.regex.match(candidate) is not None) == expected, candidate
+
+
 def test_fhirbase64binary():
     """Test FHIRBase64Binary
     https://www.hl7.org/fhir/datatypes.html#base64binary"""
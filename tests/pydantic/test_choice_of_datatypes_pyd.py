@@ -1,4 +1,5 @@
 from fhirzeug.generators.python_pydantic.templates.resource_header import (
+    choice_of_types_validator,
     choice_of_validator,
 )
 
@@ -37,6 +38,20 @@ class Y(BaseModel):
     )
 
 
+class Z(BaseModel):
+
+    a: Optional[str]
+    b: Optional[str]
+    c: Optional[str]
+    d: Optional[str]
+
+    x: int = 1
+
+    _choice_of_types_validator = root_validator(allow_reuse=True)(
+        choice_of_types_validator({"ab": ({"a", "b"}, False), "cd": ({"c", "d"}, True)})
+    )
+
+
 @pytest.mark.parametrize(
     "cls,is_ok,data",
     [
@@ -48,6 +63,12 @@ class Y(BaseModel):
         (Y, True, {"b": "Hello"}),
         (Y, True, {},),
         (Y, False, {"b": "Hello", "c": "World"}),
+        (Z, True, {"a": "Hello"}),
+        (Z, True, {"a": "Hello", "d": "World"}),
+        (Z, True, {"b": "Hello", "c": "World", "d": None}),
+        (Z, False, {"c": "World"}),
+        (Z, False, {"a": "Hello", "c": "World", "d": "!"}),
+        (Z, False, {"a": "Hello", "b": "World"}),
     ],
 )
 def test_pydantic_model(cls, is_ok, data):
@@ -58,3 +79,20 @@ def test_pydantic_model(cls, is_ok, data):
             cls(**data)
     else:
         cls(**data)
+
+
+def test_all_invalid_choices_are_reported():
+    with pytest.raises(ValidationError) as exc_info:
+        Z(c="Hello", d="World")
+    errors = exc_info.value.errors()
+    assert [error["loc"] for error in errors] == [
+        ("__root__", "cd"),
+        ("__root__", "ab"),
+    ]
+    assert errors[0]["msg"].startswith("Only one of the fields is allowed to be set")
+    assert errors[1]["msg"].startswith("At least one of the fields needs to be set")
+
+    # A single invalid choice is reported at the root, as before.
+    with pytest.raises(ValidationError) as exc_info:
+        Z(c="Hello")
+    assert [error["loc"] for error in exc_info.value.errors()] == [("__root__",)]
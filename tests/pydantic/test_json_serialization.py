@@ -1,4 +1,6 @@
 import decimal
+import io
+import json
 import typing
 
 import pytest
@@ -6,6 +8,9 @@ import pytest
 from fhirzeug.generators.python_pydantic.templates.resource_header import (
     FHIRAbstractBase,
     _without_empty_items,
+    json_dump,
+    json_dumpb,
+    json_dumps,
     json_loads,
 )
 
@@ -57,3 +62,46 @@ def test_duplicate_entries():
     json_loads('{"x": 1}')
     with pytest.raises(ValueError):
         json_loads('{"x": 1, "x": 2}')
+    with pytest.raises(ValueError, match="Duplicate key: y"):
+        json_loads('{"x": [{"y": 1, "z": 2, "y": 3}]}')
+    with pytest.raises(ValueError):
+        json_loads(b'{"x": {"x": 1}, "x": 2}')
+
+
+@pytest.mark.parametrize(
+    "raw", ['{"x": 0.1000000000000000000001}', b'{"x": 0.1000000000000000000001}']
+)
+def test_json_loads_decimal(raw: typing.Union[str, bytes]):
+    assert json_loads(raw) == {"x": decimal.Decimal("0.1000000000000000000001")}
+
+
+@pytest.mark.parametrize(
+    "obj",
+    [
+        {"decimal": decimal.Decimal("0.100000000000000000000000001")},
+        {"values": [decimal.Decimal("1E+3"), decimal.Decimal("-0.0"), 1, 1.5]},
+        {"nested": {"list": [{"value": decimal.Decimal("12.000")}]}, "text": "ü"},
+        {"text": "__decimal_0123456789abcdef_0", "value": decimal.Decimal("3.30")},
+        [],
+        {},
+    ],
+)
+def test_json_dump(obj: typing.Any):
+    expected = json_dumps(obj)
+    assert json.loads(expected, parse_float=decimal.Decimal) == obj
+
+    buffer = io.StringIO()
+    json_dump(obj, buffer)
+    assert buffer.getvalue() == expected
+
+    assert json.loads(json_dumpb(obj), parse_float=decimal.Decimal) == obj
+    assert json_dumpb(obj) == json_dumps(
+        obj, separators=(",", ":"), ensure_ascii=False
+    ).encode("utf-8")
+
+
+def test_model_json_dump():
+    model = ExampleModel(decimal="0.30000000000000000004")
+    buffer = io.StringIO()
+    json_dump(model.dict(), buffer)
+    assert buffer.getvalue() == model.json() == '{"decimal": 0.30000000000000000004}'
@@ -14,3 +14,14 @@ def test_load_config():
     config = load_config("python_pydantic")
     assert config.name == "python_pydantic"
     assert config.download_directory.destination == Path("downloads")
+
+    config = load_config("python_pydantic_v2")
+    assert config.name == "python_pydantic_v2"
+    assert all(
+        "python_pydantic_v2" in str(profile.origpath)
+        for profile in config.manual_profiles
+    )
+
+    config = load_config("python_dataclasses")
+    assert config.name == "python_dataclasses"
+    assert config.template.codesystems_source is None
@@ -5,6 +5,7 @@ import typing
 from fhirzeug.generators.python_pydantic.templates.resource_header import (
     FHIRAbstractBase,
     get_primitive_field_root_validator,
+    get_primitive_fields_root_validator,
 )
 import pydantic
 
@@ -22,8 +23,9 @@ class ExampleModel(FHIRAbstractBase):
     snake_field: OPTIONAL_LIST_T
     snake_field__extension: OPTIONAL_LIST_T
 
-    _validate_primitive_field = get_primitive_field_root_validator("field")
-    _validate_primitive_snake_field = get_primitive_field_root_validator("snake_field")
+    _validate_primitive_fields = get_primitive_fields_root_validator(
+        {"field": ("field", "_field"), "snake_field": ("snakeField", "_snakeField")}
+    )
 
 
 class ContainerModel(FHIRAbstractBase):
@@ -173,3 +175,24 @@ def test_primitive_list_field_must_fail(
                 extension_name_alias: field_extension_value,
             }
         )
+
+
+class LegacyExampleModel(FHIRAbstractBase):
+    """Model using one root validator per primitive field."""
+
+    snake_field: OPTIONAL_LIST_T
+    snake_field__extension: OPTIONAL_LIST_T
+
+    _validate_snake_field = get_primitive_field_root_validator("snake_field")
+
+
+def test_primitive_field_root_validator() -> None:
+    """The single-field validator behaves like the table-driven one."""
+    example = LegacyExampleModel(
+        **{"snakeField": ["A", None], "_snakeField": [None, "extB"]}
+    )
+    assert example.snake_field == ["A", None]
+    assert example.snake_field__extension == [None, "extB"]
+
+    with pytest.raises(pydantic.ValidationError):
+        LegacyExampleModel(snake_field=["A", "B"], snake_field__extension=["extA"])
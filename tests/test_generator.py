@@ -2,6 +2,8 @@ from pathlib import Path
 
 from fhirzeug.generator import generate
 from fhirzeug.fhirspec import FHIRSpec
+from fhirzeug.generators import load_config
+from fhirzeug.specificationcache import SpecificationCache
 
 
 def test_write(spec: FHIRSpec, tmp_path: Path):
@@ -9,3 +11,24 @@ def test_write(spec: FHIRSpec, tmp_path: Path):
     spec.generator_config.output_file.destination = Path("output.py")
     generate(spec)
     assert tmp_path.joinpath("output.py").is_file()
+
+
+def test_write_pydantic_v2(specification_cache: SpecificationCache, tmp_path: Path):
+    spec = FHIRSpec(specification_cache.cache_dir, load_config("python_pydantic_v2"))
+    spec.generator_config.output_directory.destination = tmp_path
+    spec.generator_config.output_file.destination = Path("output.py")
+    generate(spec)
+    output = tmp_path.joinpath("output.py").read_text()
+    assert "model_config = pydantic.ConfigDict(" in output
+    assert "pydantic.root_validator" not in output
+
+
+def test_write_dataclasses(specification_cache: SpecificationCache, tmp_path: Path):
+    spec = FHIRSpec(specification_cache.cache_dir, load_config("python_dataclasses"))
+    spec.generator_config.output_directory.destination = tmp_path
+    spec.generator_config.output_file.destination = Path("output.py")
+    generate(spec)
+    output = tmp_path.joinpath("output.py").read_text()
+    assert "@fhir_dataclass" in output
+    # No enum is generated for code systems.
+    assert "(str, DocEnum)" not in output